@@ -59,16 +59,401 @@ Input: JSONL file with game records, one JSON per line:
 
 USAGE
 -----
-python analyze_games.py <jsonl_file> [--limit N] [--export-players]
+python analyze_games.py <jsonl_file> [--limit N] [--stream] [--export-players]
+
+REQUIREMENTS
+-----------
+numpy is required. orjson/ujson, pysimdjson and pyarrow are optional
+accelerators picked up automatically when installed.
 """
 
 import json
+import mmap
+import os
 import sys
 import math
-from datetime import datetime
-from collections import defaultdict, Counter
+import warnings
+from array import array
+from itertools import islice
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Tuple, Optional
-import statistics
+
+import numpy as np
+
+# Fast JSON decoder selection: orjson > ujson > stdlib json.
+# Parsing dominates load time on large dumps (orjson is ~5x stdlib), but the
+# analyzer must stay runnable with a bare Python install, so these are
+# strictly optional.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+# orjson's encoder is also several times faster than stdlib json.dump and
+# writes one bytes blob instead of many small str chunks; used by the
+# player-stats export when available.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# pysimdjson goes one step further than orjson: SIMD tokenization plus lazy
+# object access, so fields the analyzer never reads (and there are many per
+# game record) are never materialized as Python objects.
+try:
+    import simdjson as _simdjson
+except ImportError:
+    _simdjson = None
+
+# msgspec compiles a C-level decoder for the fixed game schema: field names
+# are interned and type checks happen at decode time, which beats even
+# orjson when typed per-game objects are needed. Preferred backend when
+# installed.
+try:
+    import msgspec as _msgspec
+
+    class _BetResultRecord(_msgspec.Struct):
+        coef: float = 0.0
+        wonAmount: float = 0.0
+        result: bool = False
+
+    class _BetRecord(_msgspec.Struct):
+        wallet: Optional[str] = None
+        amount: float = 0.0
+        betResult: Optional[_BetResultRecord] = None
+
+    class _GameRecord(_msgspec.Struct):
+        gameNumber: int = 0
+        currentCoef: Optional[float] = None
+        totalBets: float = 0.0
+        totalWins: float = 0.0
+        totalFees: float = 0.0
+        magBurned: float = 0.0
+        timeStart: Optional[str] = None
+        timeEnd: Optional[str] = None
+        bets: List[_BetRecord] = _msgspec.field(default_factory=list)
+
+    _msgspec_decoder = _msgspec.json.Decoder(_GameRecord)
+except ImportError:
+    _msgspec = None
+    _msgspec_decoder = None
+
+# pyarrow enables a one-shot JSONL -> Parquet transcode so repeat runs skip
+# JSON parsing entirely: Parquet is columnar binary, so reloading 300k+ games
+# is a bulk read instead of 300k text parses.
+try:
+    import pyarrow as _pa
+    import pyarrow.compute as _pc
+    import pyarrow.json as _paj
+    import pyarrow.parquet as _pq
+except ImportError:
+    _pa = None
+    _pc = None
+    _paj = None
+    _pq = None
+
+# pandas is used for batch ISO8601 timestamp parsing (the format check is
+# hoisted out of the loop, ~10-20x faster than per-record fromisoformat)
+# and, where available, C-level grouped aggregations.
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+# Numba JIT-compiles the O(n) scan kernels (runs test, autocorrelation) to
+# machine code; cache=True persists the compilation across runs so the
+# one-shot CLI doesn't pay compile time every invocation.
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+# Fields the analyzer actually consumes; everything else in a game record
+# stays on the simdjson side of the FFI boundary.
+_GAME_FIELDS = ('gameNumber', 'currentCoef', 'totalBets', 'totalWins',
+                'totalFees', 'magBurned', 'timeStart', 'timeEnd')
+_BET_FIELDS = ('wallet', 'amount')
+_BET_RESULT_FIELDS = ('coef', 'wonAmount', 'result')
+
+# One C-level tuple build instead of three .get() calls per bet on the
+# array-building hot path; the .get() fallback handles records with
+# missing keys
+_get_bet_fields = itemgetter('wallet', 'amount', 'betResult')
+_get_result_fields = itemgetter('coef', 'wonAmount', 'result')
+
+# Below this many lags the direct O(n*k) dot products beat the FFT's
+# constant factor; above it the O(n log n) FFT autocorrelation wins
+_ACF_FFT_MIN_LAGS = 64
+
+# Crash categories shared by pattern detection and transition analysis:
+# np.digitize against these edges yields codes 0..4 == VL..VH
+_CATEGORY_BINS = np.array([1.5, 2.0, 3.0, 5.0])
+_CATEGORY_LABELS = ('VL', 'L', 'M', 'H', 'VH')
+
+
+def _parse_timestamps(values: List[Optional[str]]) -> np.ndarray:
+    """Batch-parse ISO8601 timestamp strings to int64 nanoseconds
+
+    Missing or malformed entries become NaT (int64 min). Batch parsing
+    beats per-record datetime.fromisoformat because the format detection
+    happens once instead of per string.
+    """
+    if _pd is not None:
+        ts = _pd.to_datetime(values, format='ISO8601', errors='coerce', utc=True)
+        return ts.tz_convert(None).to_numpy().astype('datetime64[ns]').view(np.int64)
+
+    # Drop a trailing 'Z' per string with a plain [:-1] slice (endswith is
+    # trivially cheap and a mixed Z/+00:00 file must not lose its offset
+    # entries); offset suffixes are left for NumPy, which applies them
+    # correctly but warns that datetime64 has no timezone representation —
+    # silence that noise for both conversion paths below
+    cleaned = [
+        (v[:-1] if v.endswith('Z') else v) if isinstance(v, str) else 'NaT'
+        for v in values
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', UserWarning)
+        try:
+            return np.array(cleaned, dtype='datetime64[ns]').view(np.int64)
+        except ValueError:
+            out = np.full(len(cleaned), np.datetime64('NaT'),
+                          dtype='datetime64[ns]')
+            for i, value in enumerate(cleaned):
+                try:
+                    out[i] = np.datetime64(value)
+                except ValueError:
+                    pass
+            return out.view(np.int64)
+
+
+# JSONL files above this size are split on newline boundaries and parsed by
+# a thread pool; below it the thread setup cost outweighs the gain
+_PARALLEL_MIN_BYTES = 64 << 20
+
+
+def _make_line_decoder():
+    """Build a callable that decodes one JSONL line into a game dict
+
+    Returns a fresh decoder/parser per call so each worker thread gets its
+    own instance (simdjson parsers are not thread-safe).
+    """
+    if _msgspec_decoder is not None:
+        decoder = _msgspec.json.Decoder(_GameRecord)
+        return lambda line: _game_from_struct(decoder.decode(line))
+    if _simdjson is not None:
+        parser = _simdjson.Parser()
+        return lambda line: _project_game(parser.parse(line))
+    return _json_loads
+
+
+def _parse_range(mm, lo: int, hi: int) -> List[Dict[str, Any]]:
+    """Parse the JSONL lines in mm[lo:hi] (boundaries must sit on newlines)"""
+    decode = _make_line_decoder()
+    games = []
+    pos = lo
+    while pos < hi:
+        nl = mm.find(b'\n', pos, hi)
+        if nl == -1:
+            line, pos = mm[pos:hi], hi
+        else:
+            line, pos = mm[pos:nl], nl + 1
+        if not line:
+            continue
+        try:
+            games.append(decode(line))
+        except ValueError:
+            continue
+    return games
+
+
+def _game_from_struct(record) -> Dict[str, Any]:
+    """Convert a decoded msgspec _GameRecord to the analyzer's dict shape
+
+    Fields that were absent from the JSON (None defaults) are omitted so
+    downstream .get()/'in' checks behave exactly as with stdlib json.
+    """
+    game = {
+        'gameNumber': record.gameNumber,
+        'totalBets': record.totalBets,
+        'totalWins': record.totalWins,
+        'totalFees': record.totalFees,
+        'magBurned': record.magBurned,
+    }
+    if record.currentCoef is not None:
+        game['currentCoef'] = record.currentCoef
+    if record.timeStart is not None:
+        game['timeStart'] = record.timeStart
+    if record.timeEnd is not None:
+        game['timeEnd'] = record.timeEnd
+
+    bets = []
+    for b in record.bets:
+        bet: Dict[str, Any] = {'amount': b.amount}
+        if b.wallet is not None:
+            bet['wallet'] = b.wallet
+        if b.betResult is not None:
+            bet['betResult'] = {
+                'coef': b.betResult.coef,
+                'wonAmount': b.betResult.wonAmount,
+                'result': b.betResult.result,
+            }
+        bets.append(bet)
+    game['bets'] = bets
+    return game
+
+
+def _project_game(doc) -> Dict[str, Any]:
+    """Materialize only the fields the analyzer uses from a lazy simdjson doc"""
+    game = {}
+    for key in _GAME_FIELDS:
+        value = doc.get(key)
+        if value is not None:
+            game[key] = value
+
+    bets = []
+    for b in doc.get('bets') or ():
+        bet = {}
+        for key in _BET_FIELDS:
+            value = b.get(key)
+            if value is not None:
+                bet[key] = value
+        result = b.get('betResult')
+        if result is not None:
+            bet_result = {}
+            for key in _BET_RESULT_FIELDS:
+                value = result.get(key)
+                if value is not None:
+                    bet_result[key] = value
+            bet['betResult'] = bet_result
+        bets.append(bet)
+    game['bets'] = bets
+    return game
+
+
+# =============================================================================
+# SECTION: Numeric Kernels
+# =============================================================================
+# Scalar scan loops that Numba compiles to tight machine code. When numba is
+# not installed, the plain definitions are replaced below with vectorized
+# NumPy equivalents, so both paths stay O(n) without interpreter dispatch.
+
+def _count_runs(coefs: np.ndarray, median: float) -> Tuple[int, int]:
+    """Count above/below-median runs and above-median samples in one pass
+
+    Returns:
+        (total_runs, n_above_median)
+    """
+    n1 = 0
+    runs = 1
+    prev_above = coefs[0] >= median
+    if prev_above:
+        n1 = 1
+    for i in range(1, coefs.size):
+        above = coefs[i] >= median
+        if above:
+            n1 += 1
+        if above != prev_above:
+            runs += 1
+            prev_above = above
+    return runs, n1
+
+
+def _autocorr_terms(centered: np.ndarray, lag: int) -> Tuple[float, float]:
+    """Numerator and denominator of the lag-k autocorrelation coefficient
+
+    Args:
+        centered: Mean-subtracted series (subtract once with NumPy upfront)
+        lag: Number of games to look back
+    """
+    num = 0.0
+    for i in range(centered.size - lag):
+        num += centered[i] * centered[i + lag]
+    den = 0.0
+    for i in range(centered.size):
+        den += centered[i] * centered[i]
+    return num, den
+
+
+def _rolling_std(coefs: np.ndarray, window: int) -> np.ndarray:
+    """Rolling sample stdev via a running-sum recurrence — O(n), not O(n*w)
+
+    Maintains sum and sum-of-squares in float64 and updates them with one
+    add/subtract per step instead of rescanning each window. Values in the
+    low double digits keep (s2 - s*s/w) far from cancellation.
+
+    Returns:
+        stdev of coefs[j:j+window] for each j in 0..n-window-1
+    """
+    n = coefs.size - window
+    out = np.empty(n)
+    s = 0.0
+    s2 = 0.0
+    for i in range(window):
+        v = float(coefs[i])
+        s += v
+        s2 += v * v
+    for j in range(n):
+        var = (s2 - s * s / window) / (window - 1)
+        out[j] = math.sqrt(var) if var > 0 else 0.0
+        old = float(coefs[j])
+        new = float(coefs[j + window])
+        s += new - old
+        s2 += new * new - old * old
+    return out
+
+
+if _njit is not None:
+    # Explicit signatures force compilation at import time instead of on
+    # first call — this CLI runs once and exits, so there is no warm-up to
+    # amortize lazy JIT dispatch. cache=True persists the machine code on
+    # disk; nogil=True lets the kernels run outside the GIL so they can
+    # overlap with threaded work.
+    # float32 variants cover the downcast coef column; accumulators stay
+    # float64 inside the kernels either way.
+    _count_runs = _njit(
+        ['UniTuple(int64, 2)(float64[::1], float64)',
+         'UniTuple(int64, 2)(float32[::1], float32)'],
+        cache=True, nogil=True)(_count_runs)
+    _autocorr_terms = _njit(
+        ['UniTuple(float64, 2)(float64[::1], int64)',
+         'UniTuple(float64, 2)(float32[::1], int64)'],
+        cache=True, nogil=True, fastmath=True)(_autocorr_terms)
+    _rolling_std = _njit(
+        ['float64[::1](float64[::1], int64)',
+         'float64[::1](float32[::1], int64)'],
+        cache=True, nogil=True)(_rolling_std)
+else:
+    def _count_runs(coefs, median):
+        above = coefs >= median
+        return int(np.count_nonzero(np.diff(above))) + 1, int(above.sum())
+
+    def _autocorr_terms(centered, lag):
+        return float(np.dot(centered[:-lag], centered[lag:])), float(np.dot(centered, centered))
+
+    def _rolling_std(coefs, window):
+        windows = np.lib.stride_tricks.sliding_window_view(coefs, window)[:-1]
+        return windows.std(axis=1, ddof=1).astype(np.float64)
+
+
+def _top_n_stable(vals: np.ndarray, top_n: int) -> np.ndarray:
+    """Indices of the top_n largest values, first-seen order within ties
+
+    Matches sorted(..., reverse=True)[:top_n]: argpartition alone picks an
+    arbitrary subset of the rows tied at the cutoff value, so instead keep
+    every row that reaches the cutoff, stable-sort only those (ties stay in
+    ascending-index order), and truncate to top_n.  Still O(N) selection
+    plus an O(K log K) sort over the kept rows.
+    """
+    if vals.size > top_n:
+        cutoff = np.partition(vals, -top_n)[-top_n]
+        keep = np.flatnonzero(vals >= cutoff)
+    else:
+        keep = np.arange(vals.size)
+    return keep[np.argsort(-vals[keep], kind='stable')][:top_n]
 
 
 # =============================================================================
@@ -76,13 +461,31 @@ import statistics
 # =============================================================================
 
 class GameAnalyzer:
-    """Analyzes game crash data from JSONL file"""
+    """Analyzes game crash data from JSONL file
+
+    Internally the loaded games live twice: self.games keeps the raw dicts
+    for record-level reporting, while self._arrays holds a struct-of-arrays
+    view (one contiguous NumPy column per field, plus a flattened bet
+    table) that every numeric analysis reads. Hot paths never walk the
+    dict list.
+    """
 
     def __init__(self, filepath: str):
         """Initialize analyzer with path to JSONL data file"""
         self.filepath = filepath
         self.games: List[Dict[str, Any]] = []
+        # Game count independent of self.games — load_streaming builds the
+        # columns without retaining the dicts
+        self.n_games: int = 0
         self.stats: Dict[str, Any] = {}
+        # Struct-of-arrays view of the loaded games: one contiguous NumPy
+        # array per field, built once in load_data. All numeric analyses
+        # read these instead of walking the list of per-game dicts.
+        self._arrays: Dict[str, np.ndarray] = {}
+        # Memoized derivations of the coef array (quantiles, category
+        # codes, ...) shared across the analyze_* methods so each is
+        # computed at most once per load
+        self._derived: Dict[Any, Any] = {}
 
     # =========================================================================
     # SECTION: Data Loading
@@ -95,20 +498,448 @@ class GameAnalyzer:
             limit: Maximum number of games to load (None = all)
         """
         print(f"Loading data from {self.filepath}...")
-        count = 0
 
-        with open(self.filepath, 'r') as f:
-            for line in f:
-                if limit and count >= limit:
-                    break
+        if self._load_from_cache(limit=limit):
+            self._build_arrays()
+            print(f"✓ Loaded {len(self.games):,} games (from parquet cache)")
+            return
+
+        if (limit is None and self._transcode_with_arrow()
+                and self._load_from_cache()):
+            self._build_arrays()
+            print(f"✓ Loaded {len(self.games):,} games (pyarrow ndjson reader)")
+            return
+
+        if limit is None and self._load_parallel():
+            pass
+        elif limit is None and os.path.getsize(self.filepath) > 0:
+            # Single-range variant of the parallel path: scan newline
+            # offsets over one read-only mmap and slice raw bytes straight
+            # into the decoder — no buffered line iterator, no strip(), no
+            # str decode
+            with open(self.filepath, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    self.games = _parse_range(mm, 0, mm.size())
+        else:
+            # Backend priority: msgspec typed decoder > simdjson lazy parse
+            # > orjson/ujson/stdlib. Binary mode: all the fast backends
+            # parse bytes directly, skipping the UTF-8 decode pass that
+            # text mode would pay per line. The limit is pushed into the
+            # line iterator itself so a limited run never reads (let alone
+            # parses) the rest of the file.
+            decode = _make_line_decoder()
+            append = self.games.append  # avoid per-line attribute lookup
+            with open(self.filepath, 'rb') as f:
+                lines = islice(f, limit) if limit else f
+                for line in lines:
+                    try:
+                        append(decode(line))
+                    except ValueError:
+                        continue
+
+        if limit is None:
+            self._write_cache()
+
+        self._build_arrays()
+        print(f"✓ Loaded {len(self.games):,} games")
+
+    def load_streaming(self) -> None:
+        """Load only the derived columns, discarding per-game dicts
+
+        On multi-million-row files the retained game dicts dominate RSS
+        (roughly 1KB per game vs ~100B of column data). This mode decodes
+        each line, copies its fields into the column buffers and drops the
+        dict immediately; self.games stays empty. Methods that surface raw
+        records (find_extreme_crashes, find_biggest_wins) reconstruct
+        minimal dicts from the columns instead.
+        """
+        print(f"Loading data from {self.filepath} (streaming)...")
+
+        decode = _make_line_decoder()
+
+        def stream():
+            with open(self.filepath, 'rb') as f:
+                for line in f:
+                    try:
+                        yield decode(line)
+                    except ValueError:
+                        continue
+
+        self.games = []
+        self._build_arrays(stream())
+        print(f"✓ Loaded {self.n_games:,} games (columns only)")
+
+    def _load_parallel(self) -> bool:
+        """Parse the JSONL file with one thread per CPU core
+
+        JSONL splits trivially on newlines: the mmap'd file is divided into
+        per-core byte ranges (boundaries advanced to the next newline) and
+        each range is parsed independently, then the chunks are stitched
+        back together in file order.
+
+        Returns:
+            True if the parallel path ran, False to use the serial loop
+        """
+        n_workers = os.cpu_count() or 1
+        try:
+            size = os.path.getsize(self.filepath)
+        except OSError:
+            return False
+        if n_workers < 2 or size < _PARALLEL_MIN_BYTES:
+            return False
+
+        with open(self.filepath, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                bounds = [0]
+                for i in range(1, n_workers):
+                    nl = mm.find(b'\n', size * i // n_workers)
+                    bounds.append(size if nl == -1 else nl + 1)
+                bounds.append(size)
+                bounds = sorted(set(bounds))
+
+                with ThreadPoolExecutor(max_workers=n_workers) as pool:
+                    chunks = pool.map(_parse_range, [mm] * (len(bounds) - 1),
+                                      bounds[:-1], bounds[1:])
+                    for chunk in chunks:
+                        self.games.extend(chunk)
+
+        return True
+
+    def _build_arrays(self, game_iter=None) -> None:
+        """Build the struct-of-arrays columns from game dicts
+
+        Per-game Python floats cost 28+ bytes plus a pointer indirection
+        each; packing them into contiguous float64/int64 arrays makes every
+        downstream statistic a cache-friendly vectorized pass.
+
+        Args:
+            game_iter: Iterable of game dicts; defaults to self.games.
+                load_streaming passes a generator so each dict is released
+                as soon as its fields are copied out.
+        """
+        # Every numeric column accumulates in an array.array buffer
+        # (8 bytes per entry, no PyFloat boxing or list over-allocation),
+        # which also lets the source be a single-use generator of unknown
+        # length; timestamps stay raw strings for one batch parse below.
+        coef = array('d')
+        total_bets = array('d')
+        total_wins = array('d')
+        total_fees = array('d')
+        mag_burned = array('d')
+        game_number = array('i')
+        start_raw: List[Optional[str]] = []
+        end_raw: List[Optional[str]] = []
+
+        # Flattened bet table: one row per bet across all games, linked
+        # back to its game through bet_game_idx. Wallets stay a Python
+        # list since they are strings.
+        bet_game_idx = array('q')
+        bet_wallet: List[Optional[str]] = []
+        bet_amount = array('d')
+        bet_coef = array('d')
+        bet_won_amount = array('d')
+        bet_won = array('b')
+
+        if game_iter is None:
+            game_iter = self.games
+
+        n = 0
+        for i, game in enumerate(game_iter):
+            n = i + 1
+            coef.append(game.get('currentCoef', np.nan))
+            total_bets.append(game.get('totalBets', 0))
+            total_wins.append(game.get('totalWins', 0))
+            total_fees.append(game.get('totalFees', 0))
+            mag_burned.append(game.get('magBurned', 0))
+            game_number.append(game.get('gameNumber', 0))
+            start_raw.append(game.get('timeStart'))
+            end_raw.append(game.get('timeEnd'))
+
+            for bet in game.get('bets', []):
                 try:
-                    game = json.loads(line.strip())
-                    self.games.append(game)
-                    count += 1
-                except json.JSONDecodeError:
-                    continue
+                    wallet, amount, result = _get_bet_fields(bet)
+                except KeyError:
+                    wallet = bet.get('wallet')
+                    amount = bet.get('amount', 0)
+                    result = bet.get('betResult', {})
+                try:
+                    cashout, won_amount, won = _get_result_fields(result)
+                except KeyError:
+                    cashout = result.get('coef', 0)
+                    won_amount = result.get('wonAmount', 0)
+                    won = result.get('result', False)
+
+                bet_game_idx.append(i)
+                bet_wallet.append(wallet)
+                bet_amount.append(amount)
+                bet_coef.append(cashout)
+                bet_won_amount.append(won_amount)
+                bet_won.append(bool(won))
+
+        # Timestamps are batch-parsed after the loop: one vectorized parse
+        # instead of two datetime constructions per game
+        time_start_ns = _parse_timestamps(start_raw)
+        time_end_ns = _parse_timestamps(end_raw)
+
+        self._derived.clear()
+        self.n_games = n
+
+        coef = np.frombuffer(coef, dtype=np.float64)
+        total_bets = np.frombuffer(total_bets, dtype=np.float64)
+        total_wins = np.frombuffer(total_wins, dtype=np.float64)
+        total_fees = np.frombuffer(total_fees, dtype=np.float64)
+        mag_burned = np.frombuffer(mag_burned, dtype=np.float64)
+        game_number = np.frombuffer(game_number, dtype=np.int32)
+
+        coef_mask = ~np.isnan(coef)
+        self._arrays = {
+            # Crash coefficients carry ~6 significant digits, so float32
+            # halves memory traffic on every (memory-bound) reduction over
+            # the hottest column. Statistics that print (mean/median/
+            # percentiles/stdev) promote to float64 locally. Monetary
+            # columns (totals, bet amounts) stay float64: token amounts can
+            # exceed 2^24, past which float32 drops whole units.
+            'coef': coef[coef_mask].astype(np.float32),
+            # Maps positions in the coef array back to self.games indices
+            # (games missing currentCoef are dropped from the coef column)
+            'coef_game_idx': np.flatnonzero(coef_mask),
+            'total_bets': total_bets,
+            'total_wins': total_wins,
+            'total_fees': total_fees,
+            'mag_burned': mag_burned,
+            'game_number': game_number,
+            'time_start_ns': time_start_ns,
+            'time_end_ns': time_end_ns,
+            # np.frombuffer is a zero-copy view over the array.array storage
+            'bet_game_idx': np.frombuffer(bet_game_idx, dtype=np.int64),
+            'bet_wallet': np.asarray(bet_wallet, dtype=object),
+            'bet_amount': np.frombuffer(bet_amount, dtype=np.float64),
+            'bet_coef': np.frombuffer(bet_coef, dtype=np.float64),
+            'bet_won_amount': np.frombuffer(bet_won_amount, dtype=np.float64),
+            'bet_won': np.frombuffer(bet_won, dtype=np.bool_),
+        }
 
-        print(f"✓ Loaded {len(self.games):,} games")
+    def _cache_paths(self) -> Tuple[str, str]:
+        """Paths of the parquet cache files written next to the JSONL file"""
+        return self.filepath + '.parquet', self.filepath + '.bets.parquet'
+
+    def _transcode_with_arrow(self) -> bool:
+        """Build the parquet cache straight from Arrow's C++ ndjson reader
+
+        `pyarrow.json.read_json` parses the whole file in native code with
+        an explicit schema (unknown fields ignored), so the first run never
+        materializes per-line Python dicts just to throw them away: the
+        bets list column is flattened with `list_flatten`/
+        `list_parent_indices` and both cache tables are written directly
+        from the Arrow table.
+
+        Returns:
+            True if the cache files were written, False to fall back to the
+            Python parse paths
+        """
+        if _paj is None:
+            return False
+
+        bet_struct = _pa.struct([
+            ('wallet', _pa.string()),
+            ('amount', _pa.float64()),
+            ('betResult', _pa.struct([
+                ('coef', _pa.float64()),
+                ('wonAmount', _pa.float64()),
+                ('result', _pa.bool_()),
+            ])),
+        ])
+        schema = _pa.schema([
+            ('gameNumber', _pa.int64()),
+            ('currentCoef', _pa.float64()),
+            ('totalBets', _pa.float64()),
+            ('totalWins', _pa.float64()),
+            ('totalFees', _pa.float64()),
+            ('magBurned', _pa.float64()),
+            ('timeStart', _pa.string()),
+            ('timeEnd', _pa.string()),
+            ('bets', _pa.list_(bet_struct)),
+        ])
+
+        try:
+            table = _paj.read_json(
+                self.filepath,
+                read_options=_paj.ReadOptions(block_size=8 << 20),
+                parse_options=_paj.ParseOptions(
+                    explicit_schema=schema,
+                    unexpected_field_behavior='ignore'))
+        except (OSError, _pa.ArrowInvalid):
+            return False
+
+        bets_col = table.column('bets').combine_chunks()
+        flat = _pc.list_flatten(bets_col)
+        bet_table = _pa.table({
+            'game_idx': _pc.list_parent_indices(bets_col),
+            'wallet': _pc.struct_field(flat, 'wallet'),
+            'amount': _pc.fill_null(_pc.struct_field(flat, 'amount'), 0.0),
+            'coef': _pc.fill_null(
+                _pc.struct_field(flat, ['betResult', 'coef']), 0.0),
+            'wonAmount': _pc.fill_null(
+                _pc.struct_field(flat, ['betResult', 'wonAmount']), 0.0),
+            'result': _pc.fill_null(
+                _pc.struct_field(flat, ['betResult', 'result']), False),
+        })
+
+        games_path, bets_path = self._cache_paths()
+        try:
+            _pq.write_table(table.select(list(_GAME_FIELDS)), games_path,
+                            row_group_size=65536)
+            _pq.write_table(bet_table, bets_path, row_group_size=65536)
+        except (OSError, _pa.ArrowInvalid):
+            return False
+        return True
+
+    def _write_cache(self) -> None:
+        """Transcode the loaded games to a columnar parquet cache
+
+        Games become one table of scalar columns; bets are flattened into a
+        side table keyed by game index so player analysis never needs to
+        re-parse JSON. No-op if pyarrow is not installed.
+        """
+        if _pa is None or not self.games:
+            return
+
+        game_cols = {key: [g.get(key) for g in self.games] for key in _GAME_FIELDS}
+
+        bet_cols: Dict[str, List[Any]] = {
+            'game_idx': [], 'wallet': [], 'amount': [],
+            'coef': [], 'wonAmount': [], 'result': []
+        }
+        for idx, game in enumerate(self.games):
+            for bet in game.get('bets', []):
+                result = bet.get('betResult', {})
+                bet_cols['game_idx'].append(idx)
+                bet_cols['wallet'].append(bet.get('wallet'))
+                bet_cols['amount'].append(bet.get('amount', 0))
+                bet_cols['coef'].append(result.get('coef', 0))
+                bet_cols['wonAmount'].append(result.get('wonAmount', 0))
+                bet_cols['result'].append(result.get('result', False))
+
+        games_path, bets_path = self._cache_paths()
+        try:
+            _pq.write_table(_pa.table(game_cols), games_path, row_group_size=65536)
+            _pq.write_table(_pa.table(bet_cols), bets_path, row_group_size=65536)
+        except (OSError, _pa.ArrowInvalid):
+            return
+
+    def _load_from_cache(self, limit: int = None) -> bool:
+        """Load games from the parquet cache if it is present and fresh
+
+        Returns:
+            True if the cache was used, False to fall back to JSONL parsing
+        """
+        if _pa is None:
+            return False
+
+        games_path, bets_path = self._cache_paths()
+        try:
+            source_mtime = os.path.getmtime(self.filepath)
+            if (os.path.getmtime(games_path) < source_mtime or
+                    os.path.getmtime(bets_path) < source_mtime):
+                return False
+            games_table = _pq.read_table(games_path)
+            bets_table = _pq.read_table(bets_path)
+        except (OSError, _pa.ArrowInvalid):
+            return False
+
+        if limit:
+            games_table = games_table.slice(0, limit)
+            # Drop out-of-range bet rows columnar-side instead of skipping
+            # them one by one during reconstruction
+            bets_table = bets_table.filter(
+                _pa.compute.less(bets_table.column('game_idx'), limit))
+
+        cols = games_table.to_pydict()
+        n_games = games_table.num_rows
+        self.games = []
+        for i in range(n_games):
+            game = {key: cols[key][i] for key in _GAME_FIELDS
+                    if cols[key][i] is not None}
+            game['bets'] = []
+            self.games.append(game)
+
+        bet_cols = bets_table.to_pydict()
+        for game_idx, wallet, amount, coef, won_amount, result in zip(
+                bet_cols['game_idx'], bet_cols['wallet'], bet_cols['amount'],
+                bet_cols['coef'], bet_cols['wonAmount'], bet_cols['result']):
+            if game_idx >= n_games:
+                break
+            self.games[game_idx]['bets'].append({
+                'wallet': wallet,
+                'amount': amount,
+                'betResult': {'coef': coef, 'wonAmount': won_amount, 'result': result}
+            })
+
+        return True
+
+    # =========================================================================
+    # SECTION: Derived Caches
+    # =========================================================================
+
+    def _percentiles(self, qs: Tuple[float, ...]) -> np.ndarray:
+        """Percentiles of the coef array, memoized per percentile tuple"""
+        key = ('percentiles', qs)
+        if key not in self._derived:
+            # Promote locally: the interpolation step is where float32
+            # rounding would show up in the report
+            self._derived[key] = np.percentile(
+                self._arrays['coef'].astype(np.float64), qs)
+        return self._derived[key]
+
+    def _median_coef(self) -> float:
+        """Median crash coefficient, computed once per load
+
+        Streaks, the runs test, conditional probabilities and the median
+        predictor all threshold on this same value; each np.median call is
+        an O(N log N) partition-select, so share one float64 result.
+        """
+        if 'median' not in self._derived:
+            self._derived['median'] = float(np.median(
+                self._arrays['coef'].astype(np.float64)))
+        return self._derived['median']
+
+    def _above_median(self) -> np.ndarray:
+        """Boolean above-median flags for every crash, computed once
+
+        Streak detection and the conditional-probability transitions both
+        classify the series against the same median; one comparison pass
+        serves both.
+        """
+        if 'above_median' not in self._derived:
+            self._derived['above_median'] = (
+                self._arrays['coef'] >= self._arrays['coef'].dtype.type(
+                    self._median_coef()))
+        return self._derived['above_median']
+
+    def _win_rows(self) -> np.ndarray:
+        """Row indices of winning bets in the flat bet table, computed once"""
+        if 'win_rows' not in self._derived:
+            self._derived['win_rows'] = np.flatnonzero(self._arrays['bet_won'])
+        return self._derived['win_rows']
+
+    def _centered_coefs(self) -> np.ndarray:
+        """Mean-subtracted coef series, shared by the autocorrelation paths
+
+        The mean is taken in float64 and the result stays in the column's
+        own dtype; both the lag kernel and the FFT read this one array.
+        """
+        if 'centered' not in self._derived:
+            coefs = self._arrays['coef']
+            self._derived['centered'] = coefs - coefs.dtype.type(
+                coefs.mean(dtype=np.float64))
+        return self._derived['centered']
+
+    def _category_codes(self) -> np.ndarray:
+        """Digitized VL/L/M/H/VH codes for every crash, computed once"""
+        if 'category_codes' not in self._derived:
+            self._derived['category_codes'] = np.digitize(
+                self._arrays['coef'], _CATEGORY_BINS).astype(np.uint8)
+        return self._derived['category_codes']
 
     # =========================================================================
     # SECTION: Basic Statistics
@@ -116,114 +947,198 @@ class GameAnalyzer:
 
     def analyze_crash_coefficients(self) -> Dict[str, float]:
         """Analyze crash coefficient distribution"""
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
-        if not coefs:
+        if coefs.size == 0:
             return {}
 
+        p5, p95, p99 = self._percentiles((5, 95, 99))
+
         return {
-            'mean': statistics.mean(coefs),
-            'median': statistics.median(coefs),
-            'min': min(coefs),
-            'max': max(coefs),
-            'stdev': statistics.stdev(coefs) if len(coefs) > 1 else 0,
-            'total_games': len(coefs)
+            'mean': float(coefs.mean(dtype=np.float64)),
+            'median': self._median_coef(),
+            'min': float(coefs.min()),
+            'max': float(coefs.max()),
+            'stdev': float(coefs.std(ddof=1, dtype=np.float64)) if coefs.size > 1 else 0,
+            'p5': float(p5),
+            'p95': float(p95),
+            'p99': float(p99),
+            'total_games': int(coefs.size)
         }
 
     def analyze_bet_patterns(self) -> Dict[str, Any]:
-        """Analyze betting patterns across all games"""
-        games_with_bets = [g for g in self.games if g.get('totalBets', 0) > 0]
-        all_bets = []
-
-        for game in games_with_bets:
-            all_bets.extend(game.get('bets', []))
+        """Analyze betting patterns across all games
 
-        if not all_bets:
-            return {'total_bets': 0, 'games_with_bets': 0}
+        Reads the flattened bet columns built once in _build_arrays — no
+        re-walk of the nested game/bet dicts.
+        """
+        games_with_bets = int(np.count_nonzero(self._arrays['total_bets'] > 0))
+
+        # Keep the historical scope: only bets from games whose totalBets
+        # is positive count toward the pattern stats
+        in_scope = self._arrays['total_bets'][self._arrays['bet_game_idx']] > 0
+        if in_scope.all():
+            amounts = self._arrays['bet_amount']
+            won = self._arrays['bet_won']
+        else:
+            amounts = self._arrays['bet_amount'][in_scope]
+            won = self._arrays['bet_won'][in_scope]
 
-        bet_amounts = [b['amount'] for b in all_bets if 'amount' in b]
-        won_bets = [b for b in all_bets if b.get('betResult', {}).get('result', False)]
+        if amounts.size == 0:
+            return {'total_bets': 0, 'games_with_bets': games_with_bets}
 
         return {
-            'total_bets': len(all_bets),
-            'games_with_bets': len(games_with_bets),
-            'games_without_bets': len(self.games) - len(games_with_bets),
-            'avg_bets_per_game': len(all_bets) / len(games_with_bets) if games_with_bets else 0,
-            'avg_bet_amount': statistics.mean(bet_amounts) if bet_amounts else 0,
-            'total_wagered': sum(bet_amounts) if bet_amounts else 0,
-            'win_rate': len(won_bets) / len(all_bets) if all_bets else 0,
+            'total_bets': int(amounts.size),
+            'games_with_bets': games_with_bets,
+            'games_without_bets': self.n_games - games_with_bets,
+            'avg_bets_per_game': amounts.size / games_with_bets if games_with_bets else 0,
+            'avg_bet_amount': float(amounts.mean()),
+            'total_wagered': float(amounts.sum()),
+            'win_rate': float(won.mean()),
         }
 
     def analyze_player_behavior(self) -> Dict[str, Any]:
         """Analyze unique players and their behavior"""
-        player_stats = defaultdict(lambda: {
-            'total_bets': 0,
-            'total_wagered': 0,
-            'total_won': 0,
-            'wins': 0,
-            'losses': 0
-        })
-
-        for game in self.games:
-            for bet in game.get('bets', []):
-                wallet = bet.get('wallet')
-                if not wallet:
-                    continue
-
-                amount = bet.get('amount', 0)
-                player_stats[wallet]['total_bets'] += 1
-                player_stats[wallet]['total_wagered'] += amount
-
-                result = bet.get('betResult', {})
-                if result.get('result', False):
-                    player_stats[wallet]['wins'] += 1
-                    player_stats[wallet]['total_won'] += result.get('wonAmount', 0)
-                else:
-                    player_stats[wallet]['losses'] += 1
+        # The aggregation pass is the expensive part and both the report and
+        # --export-players need it, so memoize the per-wallet dict.  A stable
+        # dict identity also lets get_top_players reuse its column cache.
+        player_stats = self._derived.get('player_stats')
+        if player_stats is None:
+            if _pd is not None:
+                player_stats = self._aggregate_players_pandas()
+            else:
+                player_stats = self._aggregate_players_python()
+            self._derived['player_stats'] = player_stats
 
         if not player_stats:
             return {'unique_players': 0}
 
-        total_bets_list = [p['total_bets'] for p in player_stats.values()]
-        wagered_list = [p['total_wagered'] for p in player_stats.values()]
+        # fromiter with a known count fills the array directly, skipping
+        # the intermediate list the comprehension would build
+        total_bets_arr = np.fromiter(
+            (p['total_bets'] for p in player_stats.values()),
+            dtype=np.float64, count=len(player_stats))
+        wagered_arr = np.fromiter(
+            (p['total_wagered'] for p in player_stats.values()),
+            dtype=np.float64, count=len(player_stats))
 
         return {
             'unique_players': len(player_stats),
-            'avg_bets_per_player': statistics.mean(total_bets_list),
-            'avg_wagered_per_player': statistics.mean(wagered_list),
-            'most_active_player_bets': max(total_bets_list),
+            'avg_bets_per_player': float(total_bets_arr.mean()),
+            'avg_wagered_per_player': float(wagered_arr.mean()),
+            'most_active_player_bets': int(total_bets_arr.max()),
             'player_stats': player_stats
         }
 
+    def _aggregate_players_pandas(self) -> Dict[str, Dict[str, Any]]:
+        """Per-wallet aggregation as one C-level pandas groupby
+
+        A categorical wallet column keeps the hashing cheap; bets without a
+        wallet become NaN categories and drop out of the groupby, matching
+        the Python path's skip behavior.
+        """
+        wallets = self._arrays['bet_wallet']
+        if wallets.size == 0:
+            return {}
+
+        df = _pd.DataFrame({
+            'wallet': _pd.Categorical(wallets),
+            'amount': self._arrays['bet_amount'],
+            'won_amount': np.where(self._arrays['bet_won'],
+                                   self._arrays['bet_won_amount'], 0.0),
+            'is_win': self._arrays['bet_won'],
+        })
+        agg = df.groupby('wallet', observed=True, sort=False).agg(
+            total_bets=('amount', 'size'),
+            total_wagered=('amount', 'sum'),
+            total_won=('won_amount', 'sum'),
+            wins=('is_win', 'sum'),
+        )
+
+        return {
+            wallet: {
+                'total_bets': int(row.total_bets),
+                'total_wagered': float(row.total_wagered),
+                'total_won': float(row.total_won),
+                'wins': int(row.wins),
+                'losses': int(row.total_bets - row.wins),
+            }
+            for wallet, row in zip(agg.index, agg.itertuples(index=False))
+        }
+
+    def _aggregate_players_python(self) -> Dict[str, Dict[str, Any]]:
+        """Pure-Python per-wallet aggregation (fallback without pandas)
+
+        Walks the flat bet columns rather than the raw game dicts, so it
+        also covers streaming loads where self.games is empty; tolist()
+        unboxes each column to plain Python objects up front. Per-player
+        state is a flat 5-slot list — index stores beat the five
+        string-keyed dict lookups per bet the old defaultdict-of-dicts
+        paid, and a new wallet costs one small list instead of a dict with
+        five hashed inserts. The public dict shape is materialized once at
+        the end.
+        """
+        acc: Dict[str, List[Any]] = {}
+
+        arrays = self._arrays
+        for wallet, amount, won, won_amount in zip(
+                arrays['bet_wallet'].tolist(),
+                arrays['bet_amount'].tolist(),
+                arrays['bet_won'].tolist(),
+                arrays['bet_won_amount'].tolist()):
+            if not wallet:
+                continue
+
+            stats = acc.get(wallet)
+            if stats is None:
+                # [total_bets, total_wagered, total_won, wins, losses]
+                stats = [0, 0, 0, 0, 0]
+                acc[wallet] = stats
+
+            stats[0] += 1
+            stats[1] += amount
+
+            if won:
+                stats[3] += 1
+                stats[2] += won_amount
+            else:
+                stats[4] += 1
+
+        return {
+            wallet: {'total_bets': total, 'total_wagered': wagered,
+                     'total_won': won, 'wins': wins, 'losses': losses}
+            for wallet, (total, wagered, won, wins, losses) in acc.items()
+        }
+
     def analyze_game_duration(self) -> Dict[str, float]:
         """Analyze game duration patterns"""
-        durations = []
-
-        for game in self.games:
-            try:
-                start = datetime.fromisoformat(game['timeStart'].replace('Z', '+00:00'))
-                end = datetime.fromisoformat(game['timeEnd'].replace('Z', '+00:00'))
-                duration = (end - start).total_seconds()
-                durations.append(duration)
-            except (KeyError, ValueError):
-                continue
+        start_ns = self._arrays['time_start_ns']
+        end_ns = self._arrays['time_end_ns']
+
+        # NaT views as int64 min; keep only games where both ends parsed
+        valid = (start_ns != np.iinfo(np.int64).min) & (end_ns != np.iinfo(np.int64).min)
+        durations = (end_ns[valid] - start_ns[valid]) / 1e9
 
-        if not durations:
+        if durations.size == 0:
             return {}
 
         return {
-            'avg_duration_seconds': statistics.mean(durations),
-            'median_duration_seconds': statistics.median(durations),
-            'min_duration_seconds': min(durations),
-            'max_duration_seconds': max(durations)
+            'avg_duration_seconds': np.mean(durations),
+            'median_duration_seconds': np.median(durations),
+            'min_duration_seconds': durations.min(),
+            'max_duration_seconds': durations.max()
         }
 
     def analyze_economics(self) -> Dict[str, float]:
-        """Analyze economic metrics (fees, burns, payouts)"""
-        total_fees = sum(g.get('totalFees', 0) for g in self.games)
-        total_mag_burned = sum(g.get('magBurned', 0) for g in self.games)
-        total_bets = sum(g.get('totalBets', 0) for g in self.games)
-        total_wins = sum(g.get('totalWins', 0) for g in self.games)
+        """Analyze economic metrics (fees, burns, payouts)
+
+        Each total is one contiguous SIMD reduction over a column filled
+        during load — no per-game dict scans.
+        """
+        total_fees = float(self._arrays['total_fees'].sum())
+        total_mag_burned = float(self._arrays['mag_burned'].sum())
+        total_bets = float(self._arrays['total_bets'].sum())
+        total_wins = float(self._arrays['total_wins'].sum())
 
         return {
             'total_fees_collected': total_fees,
@@ -231,7 +1146,7 @@ class GameAnalyzer:
             'total_wagered': total_bets,
             'total_paid_out': total_wins,
             'house_edge': ((total_bets - total_wins) / total_bets * 100) if total_bets > 0 else 0,
-            'avg_fee_per_game': total_fees / len(self.games) if self.games else 0
+            'avg_fee_per_game': total_fees / self.n_games if self.n_games else 0
         }
 
     def find_extreme_crashes(self, top_n: int = 10) -> List[Dict[str, Any]]:
@@ -243,12 +1158,23 @@ class GameAnalyzer:
         Returns:
             List of games sorted by crash coefficient
         """
-        sorted_games = sorted(
-            self.games,
-            key=lambda g: g.get('currentCoef', 0),
-            reverse=True
-        )
-        return sorted_games[:top_n]
+        coefs = self._arrays['coef']
+        if coefs.size == 0:
+            return []
+
+        # Top N coef positions in O(N) via the cutoff-inclusive selection,
+        # mapped back to game indices through coef_game_idx; equal
+        # coefficients at the boundary keep file order like the old full
+        # sort did
+        order = _top_n_stable(coefs, top_n)
+        game_rows = self._arrays['coef_game_idx'][order]
+
+        if self.games:
+            return [self.games[int(i)] for i in game_rows]
+        # Streaming load keeps no dicts; rebuild what the report shows
+        return [{'gameNumber': int(self._arrays['game_number'][i]),
+                 'currentCoef': float(coefs[o])}
+                for i, o in zip(game_rows, order)]
 
     def find_biggest_wins(self, top_n: int = 10) -> List[Tuple[Dict, Dict]]:
         """Find biggest individual bet wins
@@ -259,52 +1185,70 @@ class GameAnalyzer:
         Returns:
             List of (game, bet) tuples sorted by win amount
         """
-        all_wins = []
-
-        for game in self.games:
-            for bet in game.get('bets', []):
-                result = bet.get('betResult', {})
-                if result.get('result', False):
-                    all_wins.append((game, bet))
-
-        sorted_wins = sorted(
-            all_wins,
-            key=lambda x: x[1].get('betResult', {}).get('wonAmount', 0),
-            reverse=True
-        )
+        win_rows = self._win_rows()
+        if win_rows.size == 0:
+            return []
 
-        return sorted_wins[:top_n]
+        # Top N winning rows in O(M) via the cutoff-inclusive selection;
+        # equal win amounts at the boundary keep file order like the old
+        # full sort (and heapq.nlargest) did
+        vals = self._arrays['bet_won_amount'][win_rows]
+        top_rows = win_rows[_top_n_stable(vals, top_n)]
+
+        results = []
+        for row in top_rows:
+            game_idx = int(self._arrays['bet_game_idx'][row])
+            if self.games:
+                game = self.games[game_idx]
+            else:
+                # Streaming load keeps no dicts; rebuild the game side of
+                # the pair from the columns
+                game = {'gameNumber': int(self._arrays['game_number'][game_idx])}
+            bet = {
+                'amount': float(self._arrays['bet_amount'][row]),
+                'betResult': {
+                    'coef': float(self._arrays['bet_coef'][row]),
+                    'wonAmount': float(self._arrays['bet_won_amount'][row]),
+                    'result': True,
+                },
+            }
+            # Source bets without a wallet carry None in the column; omit
+            # the key so the report's .get(..., 'Unknown') default applies
+            wallet = self._arrays['bet_wallet'][row]
+            if wallet is not None:
+                bet['wallet'] = wallet
+            results.append((game, bet))
+        return results
 
     def analyze_cashout_timing(self) -> Dict[str, Any]:
-        """Analyze when players cash out vs crash point"""
-        early_cashouts = 0
-        late_cashouts = 0
-        total_cashouts = 0
-        cashout_ratios = []
-
-        for game in self.games:
-            crash_coef = game.get('currentCoef', 0)
-            for bet in game.get('bets', []):
-                result = bet.get('betResult', {})
-                if result.get('result', False):
-                    total_cashouts += 1
-                    cashout_coef = result.get('coef', 0)
+        """Analyze when players cash out vs crash point
 
-                    if cashout_coef > 0 and crash_coef > 0:
-                        ratio = cashout_coef / crash_coef
-                        cashout_ratios.append(ratio)
-
-                        if cashout_coef < crash_coef:
-                            early_cashouts += 1
-                        else:
-                            late_cashouts += 1
+        The per-bet crash coefficient comes from a gather over the game
+        coef column, so the whole comparison is mask arithmetic instead of
+        a nested dict walk.
+        """
+        win_rows = self._win_rows()
+
+        # Crash coef aligned to self.games positions (0.0 where missing),
+        # then gathered per winning bet through bet_game_idx
+        crash_by_game = np.zeros(self.n_games, dtype=np.float32)
+        crash_by_game[self._arrays['coef_game_idx']] = self._arrays['coef']
+        crash = crash_by_game[self._arrays['bet_game_idx'][win_rows]]
+        cashout = self._arrays['bet_coef'][win_rows]
+
+        valid = (cashout > 0) & (crash > 0)
+        ratios = cashout[valid] / crash[valid]
+        # Compare in float32 on both sides: a cashout exactly at the crash
+        # point must stay a tie (late) despite the coef column's downcast
+        early_cashouts = int(np.count_nonzero(
+            cashout[valid].astype(np.float32) < crash[valid]))
 
         return {
-            'total_cashouts': total_cashouts,
+            'total_cashouts': int(win_rows.size),
             'early_cashouts': early_cashouts,
-            'late_cashouts': late_cashouts,
-            'avg_cashout_ratio': statistics.mean(cashout_ratios) if cashout_ratios else 0,
-            'median_cashout_ratio': statistics.median(cashout_ratios) if cashout_ratios else 0
+            'late_cashouts': int(ratios.size - early_cashouts),
+            'avg_cashout_ratio': np.mean(ratios) if ratios.size else 0,
+            'median_cashout_ratio': np.median(ratios) if ratios.size else 0
         }
 
     def get_top_players(self, player_stats: Dict, metric: str, top_n: int = 10) -> List[Tuple[str, Dict]]:
@@ -318,19 +1262,56 @@ class GameAnalyzer:
         Returns:
             List of (wallet, stats) tuples
         """
-        players_list = []
-        for wallet, stats in player_stats.items():
-            enriched_stats = stats.copy()
-            enriched_stats['win_rate'] = stats['wins'] / stats['total_bets'] if stats['total_bets'] > 0 else 0
-            enriched_stats['net_profit'] = stats['total_won'] - stats['total_wagered']
-            players_list.append((wallet, enriched_stats))
+        cache = self._derived.get('player_columns')
+        if cache is None or cache['source'] is not player_stats:
+            # run_full_analysis calls this four times with different
+            # metrics over the same stats dict; extract the wallet/stats
+            # lists once and memoize each metric column on first use
+            cache = {'source': player_stats,
+                     'wallets': list(player_stats.keys()),
+                     'stats': list(player_stats.values()),
+                     'cols': {}}
+            self._derived['player_columns'] = cache
+
+        wallets = cache['wallets']
+        stats_list = cache['stats']
+        k = len(stats_list)
+        if k == 0:
+            return []
+
+        def column(key: str) -> np.ndarray:
+            if key not in cache['cols']:
+                cache['cols'][key] = np.fromiter(
+                    (s[key] for s in stats_list), dtype=np.float64, count=k)
+            return cache['cols'][key]
 
         if metric == 'win_rate':
+            counts = column('total_bets')
+            values = np.divide(column('wins'), counts,
+                               out=np.zeros(k), where=counts > 0)
             # Filter out players with less than 10 bets for meaningful win rate
-            players_list = [(w, s) for w, s in players_list if s['total_bets'] >= 10]
-
-        sorted_players = sorted(players_list, key=lambda x: x[1][metric], reverse=True)
-        return sorted_players[:top_n]
+            candidates = np.flatnonzero(counts >= 10)
+        elif metric == 'net_profit':
+            values = column('total_won') - column('total_wagered')
+            candidates = np.arange(k)
+        else:
+            values = column(metric)
+            candidates = np.arange(k)
+
+        # O(K) cutoff selection; only the rows at or above the cutoff are
+        # sorted (and the top N enriched) for display, instead of copying
+        # and sorting every player's stats dict, and boundary ties resolve
+        # by insertion order exactly like the old stable Python sort
+        top_idx = candidates[_top_n_stable(values[candidates], top_n)]
+
+        result = []
+        for i in top_idx:
+            stats = stats_list[i]
+            enriched_stats = stats.copy()
+            enriched_stats['win_rate'] = stats['wins'] / stats['total_bets'] if stats['total_bets'] > 0 else 0
+            enriched_stats['net_profit'] = stats['total_won'] - stats['total_wagered']
+            result.append((wallets[i], enriched_stats))
+        return result
 
     # =========================================================================
     # SECTION: Advanced Statistics
@@ -338,41 +1319,38 @@ class GameAnalyzer:
 
     def analyze_streaks(self) -> Dict[str, Any]:
         """Analyze streaks of consecutive high/low crashes"""
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
-        if not coefs:
+        if coefs.size == 0:
             return {}
 
-        median_coef = statistics.median(coefs)
-        current_streak = 0
-        current_type = None
-        streaks = {'high': [], 'low': []}
-
-        for coef in coefs:
-            is_high = coef >= median_coef
-            streak_type = 'high' if is_high else 'low'
+        median_coef = self._median_coef()
 
-            if streak_type == current_type:
-                current_streak += 1
-            else:
-                if current_type is not None:
-                    streaks[current_type].append(current_streak)
-                current_streak = 1
-                current_type = streak_type
+        # Edge-detect streak boundaries on the boolean mask: run lengths
+        # fall out of np.diff over the change points, no Python-level
+        # state machine needed
+        above = self._above_median()
+        change_points = np.flatnonzero(above[1:] != above[:-1]) + 1
+        bounds = np.concatenate(([0], change_points, [above.size]))
+        run_lengths = np.diff(bounds)
 
-        if current_type is not None:
-            streaks[current_type].append(current_streak)
+        # Runs alternate; whether the even-indexed ones are 'high' depends
+        # on how the series starts
+        if above[0]:
+            high_runs, low_runs = run_lengths[0::2], run_lengths[1::2]
+        else:
+            high_runs, low_runs = run_lengths[1::2], run_lengths[0::2]
 
         return {
             'median_crash': median_coef,
-            'longest_high_streak': max(streaks['high']) if streaks['high'] else 0,
-            'longest_low_streak': max(streaks['low']) if streaks['low'] else 0,
-            'avg_high_streak': statistics.mean(streaks['high']) if streaks['high'] else 0,
-            'avg_low_streak': statistics.mean(streaks['low']) if streaks['low'] else 0,
-            'total_high_streaks': len(streaks['high']),
-            'total_low_streaks': len(streaks['low']),
-            'current_streak_type': current_type,
-            'current_streak_length': current_streak
+            'longest_high_streak': int(high_runs.max()) if high_runs.size else 0,
+            'longest_low_streak': int(low_runs.max()) if low_runs.size else 0,
+            'avg_high_streak': float(high_runs.mean()) if high_runs.size else 0,
+            'avg_low_streak': float(low_runs.mean()) if low_runs.size else 0,
+            'total_high_streaks': int(high_runs.size),
+            'total_low_streaks': int(low_runs.size),
+            'current_streak_type': 'high' if above[-1] else 'low',
+            'current_streak_length': int(run_lengths[-1])
         }
 
     def analyze_autocorrelation(self, lag: int = 1) -> Dict[str, float]:
@@ -384,16 +1362,12 @@ class GameAnalyzer:
         Returns:
             Dictionary with autocorrelation coefficient
         """
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
         if len(coefs) < lag + 1:
             return {'autocorrelation': 0.0, 'lag': lag}
 
-        mean_coef = statistics.mean(coefs)
-        n = len(coefs) - lag
-
-        numerator = sum((coefs[i] - mean_coef) * (coefs[i + lag] - mean_coef) for i in range(n))
-        denominator = sum((coef - mean_coef) ** 2 for coef in coefs)
+        numerator, denominator = _autocorr_terms(self._centered_coefs(), lag)
 
         autocorr = numerator / denominator if denominator != 0 else 0
 
@@ -403,35 +1377,57 @@ class GameAnalyzer:
             'interpretation': 'Random' if abs(autocorr) < 0.1 else ('Positive correlation' if autocorr > 0 else 'Negative correlation')
         }
 
-    def runs_test(self) -> Dict[str, Any]:
-        """Wald-Wolfowitz runs test for randomness"""
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+    def autocorrelation_curve(self, max_lag: int = 50) -> np.ndarray:
+        """Autocorrelation coefficients for lags 0..max_lag
 
-        if not coefs:
-            return {}
+        Uses the direct dot-product kernel for few lags; beyond
+        _ACF_FFT_MIN_LAGS switches to the O(n log n) FFT formulation
+        (Wiener-Khinchin), which for long series computes all lags in less
+        time than the naive O(n*k) loop takes for a handful.
 
-        median = statistics.median(coefs)
-        runs = []
-        current_run = None
-        run_count = 0
+        Args:
+            max_lag: Highest lag to compute
 
-        n1 = sum(1 for c in coefs if c >= median)  # Above median
-        n2 = len(coefs) - n1  # Below median
+        Returns:
+            Array of length max_lag + 1 with acf[0] == 1.0
+        """
+        coefs = self._arrays['coef']
+        n = coefs.size
+        if n < 2:
+            return np.ones(1)
+
+        max_lag = min(max_lag, n - 1)
+        # float32 input keeps the FFT in complex64 — half the bandwidth,
+        # and the lag coefficients are only displayed to 4 decimals
+        centered = self._centered_coefs()
+        denominator = float(np.dot(centered, centered))
+        if denominator == 0:
+            return np.zeros(max_lag + 1)
+
+        if max_lag < _ACF_FFT_MIN_LAGS:
+            acf = np.empty(max_lag + 1)
+            acf[0] = 1.0
+            for k in range(1, max_lag + 1):
+                acf[k] = np.dot(centered[:-k], centered[k:]) / denominator
+            return acf
+
+        # Zero-pad to the next power of two >= 2n-1 so the circular
+        # convolution does not wrap into the lags we keep
+        m = 1 << (2 * n - 1).bit_length()
+        spectrum = np.fft.rfft(centered, n=m)
+        acf = np.fft.irfft(spectrum * np.conj(spectrum), n=m)[:max_lag + 1]
+        return acf / acf[0]
 
-        for coef in coefs:
-            above = coef >= median
-            if current_run is None or current_run != above:
-                if current_run is not None:
-                    runs.append(run_count)
-                current_run = above
-                run_count = 1
-            else:
-                run_count += 1
+    def runs_test(self) -> Dict[str, Any]:
+        """Wald-Wolfowitz runs test for randomness"""
+        coefs = self._arrays['coef']
 
-        if run_count > 0:
-            runs.append(run_count)
+        if coefs.size == 0:
+            return {}
 
-        r = len(runs)
+        median = self._median_coef()
+        r, n1 = _count_runs(coefs, coefs.dtype.type(median))
+        n2 = len(coefs) - n1  # Below median
 
         if n1 == 0 or n2 == 0:
             return {'total_runs': r, 'z_score': 0, 'interpretation': 'Insufficient data'}
@@ -465,56 +1461,56 @@ class GameAnalyzer:
         Args:
             window: Size of rolling window for volatility calculation
         """
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
         if len(coefs) < window:
             return {}
 
-        volatilities = []
-        for i in range(window, len(coefs)):
-            window_data = coefs[i-window:i]
-            vol = statistics.stdev(window_data)
-            volatilities.append(vol)
+        if len(coefs) == window:
+            return {
+                'avg_volatility': 0, 'max_volatility': 0, 'min_volatility': 0,
+                'recent_volatility': 0, 'volatility_trend': 'Stable/Decreasing'
+            }
+
+        # O(n) running-sum kernel under numba, strided-view std otherwise
+        volatilities = _rolling_std(coefs, window)
+        avg_volatility = volatilities.mean()
 
         return {
-            'avg_volatility': statistics.mean(volatilities) if volatilities else 0,
-            'max_volatility': max(volatilities) if volatilities else 0,
-            'min_volatility': min(volatilities) if volatilities else 0,
-            'recent_volatility': volatilities[-1] if volatilities else 0,
-            'volatility_trend': 'Increasing' if len(volatilities) > 1 and volatilities[-1] > statistics.mean(volatilities) else 'Stable/Decreasing'
+            'avg_volatility': avg_volatility,
+            'max_volatility': volatilities.max(),
+            'min_volatility': volatilities.min(),
+            'recent_volatility': volatilities[-1],
+            'volatility_trend': 'Increasing' if volatilities.size > 1 and volatilities[-1] > avg_volatility else 'Stable/Decreasing'
         }
 
     def analyze_distribution(self) -> Dict[str, Any]:
         """Analyze crash coefficient distribution and compare to expected"""
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
-        if not coefs:
+        if coefs.size == 0:
             return {}
 
-        # Create bins for distribution
-        bin_ranges = [(1.0, 1.5), (1.5, 2.0), (2.0, 2.5), (2.5, 3.0), (3.0, 5.0), (5.0, 10.0), (10.0, float('inf'))]
+        # One digitize pass + bincount replaces the per-coef Python ladder
+        # of range comparisons
+        bin_edges = np.array([1.5, 2.0, 2.5, 3.0, 5.0, 10.0])
         bin_labels = ['1.0-1.5x', '1.5-2.0x', '2.0-2.5x', '2.5-3.0x', '3.0-5.0x', '5.0-10.0x', '10.0x+']
 
-        distribution = Counter()
-        for coef in coefs:
-            for i, (lower, upper) in enumerate(bin_ranges):
-                if lower <= coef < upper:
-                    distribution[bin_labels[i]] += 1
-                    break
-            else:
-                # For values >= 10.0 (or any edge case)
-                distribution[bin_labels[-1]] += 1
+        idx = np.digitize(coefs, bin_edges)
+        counts = np.bincount(idx, minlength=len(bin_labels))
 
-        # Calculate percentages
+        # Empty bins stay out of the dicts, matching the old Counter shape
         total = len(coefs)
+        distribution = {label: int(count)
+                        for label, count in zip(bin_labels, counts) if count}
         dist_pct = {label: (count / total * 100) for label, count in distribution.items()}
 
         return {
-            'distribution': dict(distribution),
+            'distribution': distribution,
             'distribution_pct': dist_pct,
-            'below_2x': sum(1 for c in coefs if c < 2.0) / total * 100,
-            'above_5x': sum(1 for c in coefs if c >= 5.0) / total * 100,
-            'above_10x': sum(1 for c in coefs if c >= 10.0) / total * 100
+            'below_2x': float(np.mean(coefs < 2.0)) * 100,
+            'above_5x': float(np.mean(coefs >= 5.0)) * 100,
+            'above_10x': float(np.mean(coefs >= 10.0)) * 100
         }
 
     # =========================================================================
@@ -528,31 +1524,85 @@ class GameAnalyzer:
             pattern_length: Length of patterns to search for
             top_n: Number of top patterns to return
         """
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
         if len(coefs) < pattern_length:
             return []
 
-        # Discretize coefficients into categories
-        def categorize(coef):
-            if coef < 1.5:
-                return 'VL'  # Very Low
-            elif coef < 2.0:
-                return 'L'   # Low
-            elif coef < 3.0:
-                return 'M'   # Medium
-            elif coef < 5.0:
-                return 'H'   # High
-            else:
-                return 'VH'  # Very High
+        # Same VL/L/M/H/VH discretization as the transition matrix, via the
+        # memoized digitize pass. Each window of category codes packs into
+        # one integer key (4 bits per code), so counting distinct patterns
+        # is a np.unique over an integer vector instead of a Counter over
+        # N-k+1 Python tuples.
+        codes = self._category_codes()
+        windows = np.lib.stride_tricks.sliding_window_view(codes, pattern_length)
+        keys = np.zeros(windows.shape[0], dtype=np.uint64)
+        for j in range(pattern_length):
+            keys = (keys << np.uint64(4)) | windows[:, j]
+
+        uniq, first_seen, counts = np.unique(
+            keys, return_index=True, return_counts=True)
+
+        # Match Counter.most_common ordering: count descending, ties by
+        # first appearance in the series
+        order = np.lexsort((first_seen, -counts))[:top_n]
+
+        results = []
+        for key, count in zip(uniq[order], counts[order]):
+            key = int(key)
+            pattern = tuple(
+                _CATEGORY_LABELS[(key >> (4 * (pattern_length - 1 - j))) & 0xF]
+                for j in range(pattern_length))
+            results.append((pattern, int(count)))
+        return results
+
+    def analyze_transition_matrix(self) -> Dict[str, Any]:
+        """Estimate Markov transition probabilities between crash categories
+
+        Categories match find_patterns (VL/L/M/H/VH). The whole matrix is
+        tallied in one vectorized pass: digitize the series once, encode
+        each adjacent pair as a single integer, and histogram the pair ids
+        with np.bincount.
+
+        Returns:
+            Dictionary with raw transition counts and row-stochastic
+            probabilities, both keyed by category labels
+        """
+        coefs = self._arrays['coef']
 
-        patterns = []
-        for i in range(len(coefs) - pattern_length + 1):
-            pattern = tuple(categorize(coefs[i + j]) for j in range(pattern_length))
-            patterns.append(pattern)
+        if coefs.size < 2:
+            return {}
+
+        k = len(_CATEGORY_LABELS)
+        buckets = self._category_codes()
+
+        # Pack each adjacent pair into one byte-wide key (4 bits per
+        # category code, k <= 16): a single fused shift-or ufunc instead of
+        # a multiply-add, and the bincount stays a fixed 256 bins
+        pair_ids = (buckets[:-1].astype(np.uint16) << 4) | buckets[1:]
+        counts = np.bincount(pair_ids, minlength=256).reshape(16, 16)[:k, :k]
+
+        row_totals = counts.sum(axis=1, keepdims=True)
+        probs = np.divide(counts, row_totals,
+                          out=np.zeros((k, k)), where=row_totals > 0)
+
+        # Same-category run lengths from one vectorized adjacent-compare
+        change_points = np.flatnonzero(buckets[1:] != buckets[:-1]) + 1
+        bounds = np.concatenate(([0], change_points, [buckets.size]))
+        run_lengths = np.diff(bounds)
+        run_labels = buckets[bounds[:-1]]
+        longest_runs = {
+            label: int(run_lengths[run_labels == code].max())
+            if np.any(run_labels == code) else 0
+            for code, label in enumerate(_CATEGORY_LABELS)
+        }
 
-        pattern_counts = Counter(patterns)
-        return pattern_counts.most_common(top_n)
+        return {
+            'labels': _CATEGORY_LABELS,
+            'counts': counts,
+            'probabilities': probs,
+            'longest_runs': longest_runs
+        }
 
     # =========================================================================
     # SECTION: Predictions
@@ -580,130 +1630,127 @@ class GameAnalyzer:
             - trend: 'Increasing', 'Decreasing', or 'Stable'
             - recent_10_avg, recent_10_min, recent_10_max: Context
         """
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
         if len(coefs) < 10:
             return {'error': 'Insufficient data for prediction'}
 
         predictions = {}
 
+        # The last-10 window feeds the SMA, the trend estimate and the
+        # recent-context block; slice it and take its mean once
+        last_10 = coefs[-10:]
+        last_10_avg = np.mean(last_10)
+
         # Simple Moving Average (last 10, 50, 100 games)
         if not prediction_methods or 'sma' in prediction_methods:
-            predictions['sma_10'] = statistics.mean(coefs[-10:])
+            predictions['sma_10'] = last_10_avg
             if len(coefs) >= 50:
-                predictions['sma_50'] = statistics.mean(coefs[-50:])
+                predictions['sma_50'] = np.mean(coefs[-50:])
             if len(coefs) >= 100:
-                predictions['sma_100'] = statistics.mean(coefs[-100:])
+                predictions['sma_100'] = np.mean(coefs[-100:])
 
         # Exponential Moving Average (more weight on recent)
         if not prediction_methods or 'ema' in prediction_methods:
             alpha = 0.2  # Smoothing factor
-            ema = coefs[0]
-            for coef in coefs[1:]:
-                ema = alpha * coef + (1 - alpha) * ema
-            predictions['ema'] = ema
+            if _pd is not None:
+                # C-level scan; adjust=False matches the recursive form
+                # ema = alpha*x + (1-alpha)*ema seeded from the first value
+                predictions['ema'] = float(
+                    _pd.Series(coefs).ewm(alpha=alpha, adjust=False).mean().iloc[-1])
+            else:
+                ema = coefs[0]
+                for coef in coefs[1:]:
+                    ema = alpha * coef + (1 - alpha) * ema
+                predictions['ema'] = ema
 
         # Weighted Moving Average (linear decay)
         if not prediction_methods or 'wma' in prediction_methods:
             recent = coefs[-20:] if len(coefs) >= 20 else coefs
-            weights = list(range(1, len(recent) + 1))
-            wma = sum(c * w for c, w in zip(recent, weights)) / sum(weights)
-            predictions['wma'] = wma
+            weights = np.arange(1, len(recent) + 1, dtype=np.float64)
+            predictions['wma'] = float(np.dot(recent, weights) / weights.sum())
 
         # Pattern-based prediction (find similar recent sequences)
         if not prediction_methods or 'pattern' in prediction_methods:
             if len(coefs) >= 6:
+                n = len(coefs)
                 last_pattern = coefs[-5:]  # Last 5 games
-                similar_outcomes = []
 
-                for i in range(len(coefs) - 6):
-                    pattern = coefs[i:i+5]
-                    # Calculate similarity (inverse of mean squared difference)
-                    diff = sum((a - b) ** 2 for a, b in zip(pattern, last_pattern))
-                    if diff < 2.0:  # Similar patterns
-                        similar_outcomes.append(coefs[i+5])
+                # Score every historical 5-game window against the last one
+                # in a single vectorized pass: the window matrix is a
+                # zero-copy strided view, similarity is a row-wise squared
+                # difference, and the matching outcomes fall out of a mask
+                windows = np.lib.stride_tricks.sliding_window_view(coefs, 5)[:n - 6]
+                diffs = ((windows - last_pattern) ** 2).sum(axis=1)
+                similar_outcomes = coefs[5:n - 1][diffs < 2.0]
 
-                if similar_outcomes:
-                    predictions['pattern_based'] = statistics.mean(similar_outcomes)
-                    predictions['pattern_matches'] = len(similar_outcomes)
+                if similar_outcomes.size:
+                    predictions['pattern_based'] = float(similar_outcomes.mean())
+                    predictions['pattern_matches'] = int(similar_outcomes.size)
 
         # Statistical measures
         if not prediction_methods or 'median' in prediction_methods:
-            predictions['median'] = statistics.median(coefs)
+            predictions['median'] = self._median_coef()
 
         # Mode range (most common range)
         if not prediction_methods or 'mode_range' in prediction_methods:
-            ranges = []
-            for coef in coefs[-100:] if len(coefs) >= 100 else coefs:
-                if coef < 1.5:
-                    ranges.append(1.2)
-                elif coef < 2.0:
-                    ranges.append(1.7)
-                elif coef < 3.0:
-                    ranges.append(2.5)
-                elif coef < 5.0:
-                    ranges.append(4.0)
-                else:
-                    ranges.append(7.0)
-
-            if ranges:
-                predictions['mode_range'] = statistics.mode(ranges)
+            # Range edges match _CATEGORY_BINS, so the memoized digitize
+            # codes stand in for the old per-coef ladder; the mode is a
+            # bincount argmax over the last 100 codes
+            recent_codes = self._category_codes()[-100:]
+            if recent_codes.size:
+                range_centers = np.array([1.2, 1.7, 2.5, 4.0, 7.0])
+                predictions['mode_range'] = float(
+                    range_centers[np.bincount(recent_codes).argmax()])
 
         # Trend-adjusted prediction
         if len(coefs) >= 20:
-            recent_avg = statistics.mean(coefs[-10:])
-            older_avg = statistics.mean(coefs[-20:-10])
+            recent_avg = last_10_avg
+            older_avg = np.mean(coefs[-20:-10])
             trend = recent_avg - older_avg
             trend_pred = recent_avg + (trend * 0.5)  # 50% trend continuation
             predictions['trend_adjusted'] = max(1.0, trend_pred)  # Never predict below 1.0x
             predictions['trend'] = 'Increasing' if trend > 0.1 else ('Decreasing' if trend < -0.1 else 'Stable')
 
         # Calculate consensus prediction (average of all methods, excluding outliers)
-        valid_predictions = [v for v in predictions.values() if isinstance(v, (int, float)) and 1.0 <= v <= 50.0]
+        # np.floating covers float32 method outputs (np.float32 is not a
+        # subclass of Python float, unlike np.float64)
+        valid_predictions = [v for v in predictions.values() if isinstance(v, (int, float, np.floating)) and 1.0 <= v <= 50.0]
         if valid_predictions:
             # Use median for robustness against outliers
-            predictions['consensus'] = statistics.median(valid_predictions)
-            predictions['prediction_std'] = statistics.stdev(valid_predictions) if len(valid_predictions) > 1 else 0
+            predictions['consensus'] = np.median(valid_predictions)
+            predictions['prediction_std'] = np.std(valid_predictions, ddof=1) if len(valid_predictions) > 1 else 0
             predictions['confidence'] = 'High' if predictions['prediction_std'] < 0.5 else ('Medium' if predictions['prediction_std'] < 1.5 else 'Low')
 
         # Recent statistics for context
-        predictions['recent_10_avg'] = statistics.mean(coefs[-10:])
-        predictions['recent_10_min'] = min(coefs[-10:])
-        predictions['recent_10_max'] = max(coefs[-10:])
+        predictions['recent_10_avg'] = last_10_avg
+        predictions['recent_10_min'] = last_10.min()
+        predictions['recent_10_max'] = last_10.max()
         predictions['last_game'] = coefs[-1]
 
         return predictions
 
     def analyze_conditional_probabilities(self) -> Dict[str, Any]:
         """Analyze conditional probabilities (e.g., P(high | after low))"""
-        coefs = [g['currentCoef'] for g in self.games if 'currentCoef' in g]
+        coefs = self._arrays['coef']
 
         if len(coefs) < 2:
             return {}
 
-        median = statistics.median(coefs)
+        median = self._median_coef()
 
-        # Count transitions
+        # Pack each (current, next) pair into a 2-bit state and histogram
+        # with bincount — three array ops instead of a 4-way branch per game
+        above = self._above_median().astype(np.uint8)
+        states = (above[:-1] << 1) | above[1:]
+        counts = np.bincount(states, minlength=4)
         transitions = {
-            'low_to_low': 0,
-            'low_to_high': 0,
-            'high_to_low': 0,
-            'high_to_high': 0
+            'low_to_low': int(counts[0]),
+            'low_to_high': int(counts[1]),
+            'high_to_low': int(counts[2]),
+            'high_to_high': int(counts[3])
         }
 
-        for i in range(len(coefs) - 1):
-            current_high = coefs[i] >= median
-            next_high = coefs[i + 1] >= median
-
-            if current_high and next_high:
-                transitions['high_to_high'] += 1
-            elif current_high and not next_high:
-                transitions['high_to_low'] += 1
-            elif not current_high and next_high:
-                transitions['low_to_high'] += 1
-            else:
-                transitions['low_to_low'] += 1
-
         total_after_low = transitions['low_to_low'] + transitions['low_to_high']
         total_after_high = transitions['high_to_low'] + transitions['high_to_high']
 
@@ -721,72 +1768,80 @@ class GameAnalyzer:
     # =========================================================================
 
     def run_full_analysis(self) -> None:
-        """Run complete analysis and display results"""
-        print("\n" + "="*60)
-        print("GAME CRASH DATA ANALYSIS")
-        print("="*60)
+        """Run complete analysis and display results
+
+        Report lines accumulate in a list and reach stdout as one buffered
+        write at the end, instead of ~135 individual print calls each
+        paying its own stream flush.
+        """
+        out: List[str] = []
+        emit = out.append
+
+        emit("\n" + "="*60)
+        emit("GAME CRASH DATA ANALYSIS")
+        emit("="*60)
 
         # Crash Coefficients
-        print("\n📊 CRASH COEFFICIENT ANALYSIS")
-        print("-"*60)
+        emit("\n📊 CRASH COEFFICIENT ANALYSIS")
+        emit("-"*60)
         crash_stats = self.analyze_crash_coefficients()
         for key, value in crash_stats.items():
             if key == 'total_games':
-                print(f"{key:20}: {value:,}")
+                emit(f"{key:20}: {value:,}")
             else:
-                print(f"{key:20}: {value:.2f}")
+                emit(f"{key:20}: {value:.2f}")
 
         # Betting Patterns
-        print("\n🎲 BETTING PATTERNS")
-        print("-"*60)
+        emit("\n🎲 BETTING PATTERNS")
+        emit("-"*60)
         bet_stats = self.analyze_bet_patterns()
         for key, value in bet_stats.items():
             if isinstance(value, float):
                 if 'rate' in key:
-                    print(f"{key:20}: {value:.2%}")
+                    emit(f"{key:20}: {value:.2%}")
                 else:
-                    print(f"{key:20}: {value:,.2f}")
+                    emit(f"{key:20}: {value:,.2f}")
             else:
-                print(f"{key:20}: {value:,}")
+                emit(f"{key:20}: {value:,}")
 
         # Player Behavior
-        print("\n👥 PLAYER BEHAVIOR")
-        print("-"*60)
+        emit("\n👥 PLAYER BEHAVIOR")
+        emit("-"*60)
         player_stats = self.analyze_player_behavior()
         for key, value in player_stats.items():
             if key == 'player_stats':
                 continue
             if isinstance(value, float):
-                print(f"{key:20}: {value:,.2f}")
+                emit(f"{key:20}: {value:,.2f}")
             else:
-                print(f"{key:20}: {value:,}")
+                emit(f"{key:20}: {value:,}")
 
         # Game Duration
-        print("\n⏱️  GAME DURATION")
-        print("-"*60)
+        emit("\n⏱️  GAME DURATION")
+        emit("-"*60)
         duration_stats = self.analyze_game_duration()
         for key, value in duration_stats.items():
-            print(f"{key:20}: {value:.2f}s ({value/60:.2f}m)")
+            emit(f"{key:20}: {value:.2f}s ({value/60:.2f}m)")
 
         # Economics
-        print("\n💰 ECONOMIC METRICS")
-        print("-"*60)
+        emit("\n💰 ECONOMIC METRICS")
+        emit("-"*60)
         econ_stats = self.analyze_economics()
         for key, value in econ_stats.items():
             if 'edge' in key or 'rate' in key:
-                print(f"{key:20}: {value:.2f}%")
+                emit(f"{key:20}: {value:.2f}%")
             else:
-                print(f"{key:20}: {value:,.2f}")
+                emit(f"{key:20}: {value:,.2f}")
 
         # Cashout Timing
-        print("\n⏰ CASHOUT TIMING ANALYSIS")
-        print("-"*60)
+        emit("\n⏰ CASHOUT TIMING ANALYSIS")
+        emit("-"*60)
         cashout_stats = self.analyze_cashout_timing()
         for key, value in cashout_stats.items():
             if 'ratio' in key:
-                print(f"{key:20}: {value:.2%}")
+                emit(f"{key:20}: {value:.2%}")
             else:
-                print(f"{key:20}: {value:,}")
+                emit(f"{key:20}: {value:,}")
 
         # Top Players Sections
         player_behavior = self.analyze_player_behavior()
@@ -794,215 +1849,236 @@ class GameAnalyzer:
 
         if player_stats_dict:
             # Most Active Players
-            print("\n🎯 TOP 10 MOST ACTIVE PLAYERS (by total bets)")
-            print("-"*60)
+            emit("\n🎯 TOP 10 MOST ACTIVE PLAYERS (by total bets)")
+            emit("-"*60)
             top_active = self.get_top_players(player_stats_dict, 'total_bets', 10)
             for i, (wallet, stats) in enumerate(top_active, 1):
-                print(f"{i:2}. {wallet}: {stats['total_bets']:,} bets | "
+                emit(f"{i:2}. {wallet}: {stats['total_bets']:,} bets | "
                       f"Win rate: {stats['win_rate']:.1%} | "
                       f"Net: {stats['net_profit']:+.2f}")
 
             # Highest Wagered
-            print("\n💸 TOP 10 HIGHEST WAGERED (by total amount)")
-            print("-"*60)
+            emit("\n💸 TOP 10 HIGHEST WAGERED (by total amount)")
+            emit("-"*60)
             top_wagered = self.get_top_players(player_stats_dict, 'total_wagered', 10)
             for i, (wallet, stats) in enumerate(top_wagered, 1):
-                print(f"{i:2}. {wallet}: {stats['total_wagered']:,.2f} wagered | "
+                emit(f"{i:2}. {wallet}: {stats['total_wagered']:,.2f} wagered | "
                       f"{stats['total_bets']:,} bets | "
                       f"Net: {stats['net_profit']:+,.2f}")
 
             # Biggest Winners
-            print("\n🤑 TOP 10 BIGGEST WINNERS (by total won)")
-            print("-"*60)
+            emit("\n🤑 TOP 10 BIGGEST WINNERS (by total won)")
+            emit("-"*60)
             top_winners = self.get_top_players(player_stats_dict, 'total_won', 10)
             for i, (wallet, stats) in enumerate(top_winners, 1):
-                print(f"{i:2}. {wallet}: {stats['total_won']:,.2f} won | "
+                emit(f"{i:2}. {wallet}: {stats['total_won']:,.2f} won | "
                       f"Wagered: {stats['total_wagered']:,.2f} | "
                       f"Net: {stats['net_profit']:+,.2f}")
 
             # Most Profitable
-            print("\n📈 TOP 10 MOST PROFITABLE PLAYERS (by net profit)")
-            print("-"*60)
+            emit("\n📈 TOP 10 MOST PROFITABLE PLAYERS (by net profit)")
+            emit("-"*60)
             top_profit = self.get_top_players(player_stats_dict, 'net_profit', 10)
             for i, (wallet, stats) in enumerate(top_profit, 1):
-                print(f"{i:2}. {wallet}: {stats['net_profit']:+,.2f} profit | "
+                emit(f"{i:2}. {wallet}: {stats['net_profit']:+,.2f} profit | "
                       f"Win rate: {stats['win_rate']:.1%} | "
                       f"{stats['total_bets']:,} bets")
 
             # Best Win Rates (min 10 bets)
-            print("\n🎲 TOP 10 BEST WIN RATES (min 10 bets)")
-            print("-"*60)
+            emit("\n🎲 TOP 10 BEST WIN RATES (min 10 bets)")
+            emit("-"*60)
             top_winrate = self.get_top_players(player_stats_dict, 'win_rate', 10)
             for i, (wallet, stats) in enumerate(top_winrate, 1):
-                print(f"{i:2}. {wallet}: {stats['win_rate']:.1%} | "
+                emit(f"{i:2}. {wallet}: {stats['win_rate']:.1%} | "
                       f"{stats['wins']}/{stats['total_bets']} wins | "
                       f"Net: {stats['net_profit']:+,.2f}")
 
         # Extreme Crashes
-        print("\n🚀 TOP 10 HIGHEST CRASHES")
-        print("-"*60)
+        emit("\n🚀 TOP 10 HIGHEST CRASHES")
+        emit("-"*60)
         top_crashes = self.find_extreme_crashes(10)
         for i, game in enumerate(top_crashes, 1):
-            print(f"{i:2}. Game #{game['gameNumber']:,}: {game['currentCoef']:.2f}x")
+            emit(f"{i:2}. Game #{game['gameNumber']:,}: {game['currentCoef']:.2f}x")
 
         # Biggest Wins
-        print("\n🏆 TOP 10 BIGGEST WINS")
-        print("-"*60)
+        emit("\n🏆 TOP 10 BIGGEST WINS")
+        emit("-"*60)
         top_wins = self.find_biggest_wins(10)
         for i, (game, bet) in enumerate(top_wins, 1):
             result = bet['betResult']
             wallet = bet.get('wallet', 'Unknown')
-            print(f"{i:2}. {result['wonAmount']:.2f} (bet: {bet['amount']:.2f} @ {result['coef']:.2f}x)")
-            print(f"    Wallet: {wallet} | Game #{game['gameNumber']}")
+            emit(f"{i:2}. {result['wonAmount']:.2f} (bet: {bet['amount']:.2f} @ {result['coef']:.2f}x)")
+            emit(f"    Wallet: {wallet} | Game #{game['gameNumber']}")
 
         # Advanced Statistical Tests
-        print("\n📐 ADVANCED STATISTICAL TESTS")
-        print("-"*60)
+        emit("\n📐 ADVANCED STATISTICAL TESTS")
+        emit("-"*60)
 
         # Runs Test
         runs_stats = self.runs_test()
         if runs_stats:
-            print(f"Runs Test:")
-            print(f"  Total runs: {runs_stats.get('total_runs', 0):,}")
-            print(f"  Expected runs: {runs_stats.get('expected_runs', 0):.2f}")
-            print(f"  Z-score: {runs_stats.get('z_score', 0):.3f}")
-            print(f"  Result: {runs_stats.get('interpretation', 'N/A')}")
-            print(f"  Is random: {'✅ YES' if runs_stats.get('is_random', False) else '❌ NO'}")
+            emit(f"Runs Test:")
+            emit(f"  Total runs: {runs_stats.get('total_runs', 0):,}")
+            emit(f"  Expected runs: {runs_stats.get('expected_runs', 0):.2f}")
+            emit(f"  Z-score: {runs_stats.get('z_score', 0):.3f}")
+            emit(f"  Result: {runs_stats.get('interpretation', 'N/A')}")
+            emit(f"  Is random: {'✅ YES' if runs_stats.get('is_random', False) else '❌ NO'}")
 
         # Autocorrelation
-        print(f"\nAutocorrelation (lag-1):")
+        emit(f"\nAutocorrelation (lag-1):")
         autocorr = self.analyze_autocorrelation(lag=1)
-        print(f"  Coefficient: {autocorr.get('autocorrelation', 0):.3f}")
-        print(f"  Interpretation: {autocorr.get('interpretation', 'N/A')}")
+        emit(f"  Coefficient: {autocorr.get('autocorrelation', 0):.3f}")
+        emit(f"  Interpretation: {autocorr.get('interpretation', 'N/A')}")
+
+        acf = self.autocorrelation_curve(max_lag=10)
+        if acf.size > 10:
+            emit(f"  Higher lags: " +
+                  ", ".join(f"lag-{k}: {acf[k]:+.3f}" for k in (2, 3, 5, 10)))
 
         # Streaks Analysis
-        print("\n🔥 STREAKS ANALYSIS")
-        print("-"*60)
+        emit("\n🔥 STREAKS ANALYSIS")
+        emit("-"*60)
         streak_stats = self.analyze_streaks()
         if streak_stats:
-            print(f"Median crash point: {streak_stats.get('median_crash', 0):.2f}x")
-            print(f"Longest high streak: {streak_stats.get('longest_high_streak', 0):,} games")
-            print(f"Longest low streak: {streak_stats.get('longest_low_streak', 0):,} games")
-            print(f"Average high streak: {streak_stats.get('avg_high_streak', 0):.2f} games")
-            print(f"Average low streak: {streak_stats.get('avg_low_streak', 0):.2f} games")
-            print(f"Current streak: {streak_stats.get('current_streak_length', 0)} {streak_stats.get('current_streak_type', 'N/A')} games")
+            emit(f"Median crash point: {streak_stats.get('median_crash', 0):.2f}x")
+            emit(f"Longest high streak: {streak_stats.get('longest_high_streak', 0):,} games")
+            emit(f"Longest low streak: {streak_stats.get('longest_low_streak', 0):,} games")
+            emit(f"Average high streak: {streak_stats.get('avg_high_streak', 0):.2f} games")
+            emit(f"Average low streak: {streak_stats.get('avg_low_streak', 0):.2f} games")
+            emit(f"Current streak: {streak_stats.get('current_streak_length', 0)} {streak_stats.get('current_streak_type', 'N/A')} games")
 
         # Distribution Analysis
-        print("\n📊 DISTRIBUTION ANALYSIS")
-        print("-"*60)
+        emit("\n📊 DISTRIBUTION ANALYSIS")
+        emit("-"*60)
         dist_stats = self.analyze_distribution()
         if dist_stats:
-            print("Crash ranges:")
+            emit("Crash ranges:")
             for label, count in dist_stats.get('distribution', {}).items():
                 pct = dist_stats.get('distribution_pct', {}).get(label, 0)
-                print(f"  {label:12}: {count:6,} games ({pct:5.2f}%)")
-            print(f"\nBelow 2.0x: {dist_stats.get('below_2x', 0):.2f}%")
-            print(f"Above 5.0x: {dist_stats.get('above_5x', 0):.2f}%")
-            print(f"Above 10.0x: {dist_stats.get('above_10x', 0):.2f}%")
+                emit(f"  {label:12}: {count:6,} games ({pct:5.2f}%)")
+            emit(f"\nBelow 2.0x: {dist_stats.get('below_2x', 0):.2f}%")
+            emit(f"Above 5.0x: {dist_stats.get('above_5x', 0):.2f}%")
+            emit(f"Above 10.0x: {dist_stats.get('above_10x', 0):.2f}%")
 
         # Volatility Analysis
-        print("\n📉 VOLATILITY ANALYSIS")
-        print("-"*60)
+        emit("\n📉 VOLATILITY ANALYSIS")
+        emit("-"*60)
         vol_stats = self.analyze_volatility(window=20)
         if vol_stats:
-            print(f"Average volatility: {vol_stats.get('avg_volatility', 0):.3f}")
-            print(f"Recent volatility: {vol_stats.get('recent_volatility', 0):.3f}")
-            print(f"Max volatility: {vol_stats.get('max_volatility', 0):.3f}")
-            print(f"Min volatility: {vol_stats.get('min_volatility', 0):.3f}")
-            print(f"Trend: {vol_stats.get('volatility_trend', 'N/A')}")
+            emit(f"Average volatility: {vol_stats.get('avg_volatility', 0):.3f}")
+            emit(f"Recent volatility: {vol_stats.get('recent_volatility', 0):.3f}")
+            emit(f"Max volatility: {vol_stats.get('max_volatility', 0):.3f}")
+            emit(f"Min volatility: {vol_stats.get('min_volatility', 0):.3f}")
+            emit(f"Trend: {vol_stats.get('volatility_trend', 'N/A')}")
 
         # Conditional Probabilities
-        print("\n🎯 CONDITIONAL PROBABILITIES")
-        print("-"*60)
+        emit("\n🎯 CONDITIONAL PROBABILITIES")
+        emit("-"*60)
         cond_prob = self.analyze_conditional_probabilities()
         if cond_prob:
-            print(f"Median threshold: {cond_prob.get('median_threshold', 0):.2f}x")
-            print(f"P(High | after Low): {cond_prob.get('prob_high_after_low', 0):.1%}")
-            print(f"P(Low | after Low): {cond_prob.get('prob_low_after_low', 0):.1%}")
-            print(f"P(High | after High): {cond_prob.get('prob_high_after_high', 0):.1%}")
-            print(f"P(Low | after High): {cond_prob.get('prob_low_after_high', 0):.1%}")
+            emit(f"Median threshold: {cond_prob.get('median_threshold', 0):.2f}x")
+            emit(f"P(High | after Low): {cond_prob.get('prob_high_after_low', 0):.1%}")
+            emit(f"P(Low | after Low): {cond_prob.get('prob_low_after_low', 0):.1%}")
+            emit(f"P(High | after High): {cond_prob.get('prob_high_after_high', 0):.1%}")
+            emit(f"P(Low | after High): {cond_prob.get('prob_low_after_high', 0):.1%}")
+
+        # Category Transition Matrix
+        emit("\n🔁 CATEGORY TRANSITION PROBABILITIES")
+        emit("-"*60)
+        transition = self.analyze_transition_matrix()
+        if transition:
+            labels = transition['labels']
+            emit("From\\To " + "".join(f"{label:>8}" for label in labels))
+            for i, label in enumerate(labels):
+                row = transition['probabilities'][i]
+                emit(f"{label:7} " + "".join(f"{p:7.1%} " for p in row))
+            longest = transition['longest_runs']
+            emit("Longest same-category runs: " +
+                  ", ".join(f"{label}: {longest[label]}" for label in labels))
 
         # Pattern Recognition
-        print("\n🔍 TOP 10 MOST COMMON PATTERNS (3-game sequences)")
-        print("-"*60)
+        emit("\n🔍 TOP 10 MOST COMMON PATTERNS (3-game sequences)")
+        emit("-"*60)
         patterns = self.find_patterns(pattern_length=3, top_n=10)
         if patterns:
             pattern_legend = "VL=<1.5x, L=1.5-2x, M=2-3x, H=3-5x, VH=>5x"
-            print(f"Legend: {pattern_legend}")
+            emit(f"Legend: {pattern_legend}")
             for i, (pattern, count) in enumerate(patterns, 1):
                 pattern_str = '-'.join(pattern)
-                pct = (count / (len(self.games) - 2)) * 100 if len(self.games) > 2 else 0
-                print(f"{i:2}. {pattern_str:12} → {count:5,} times ({pct:4.2f}%)")
+                pct = (count / (self.n_games - 2)) * 100 if self.n_games > 2 else 0
+                emit(f"{i:2}. {pattern_str:12} → {count:5,} times ({pct:4.2f}%)")
 
         # PREDICTION SECTION
-        print("\n" + "="*60)
-        print("🔮 NEXT OUTCOME PREDICTIONS")
-        print("="*60)
+        emit("\n" + "="*60)
+        emit("🔮 NEXT OUTCOME PREDICTIONS")
+        emit("="*60)
 
         predictions = self.predict_next_outcome()
         if 'error' not in predictions:
             # Show recent context
-            print(f"\n📍 RECENT CONTEXT")
-            print(f"   Last game: {predictions.get('last_game', 0):.2f}x")
-            print(f"   Recent 10 avg: {predictions.get('recent_10_avg', 0):.2f}x")
-            print(f"   Recent 10 range: {predictions.get('recent_10_min', 0):.2f}x - {predictions.get('recent_10_max', 0):.2f}x")
+            emit(f"\n📍 RECENT CONTEXT")
+            emit(f"   Last game: {predictions.get('last_game', 0):.2f}x")
+            emit(f"   Recent 10 avg: {predictions.get('recent_10_avg', 0):.2f}x")
+            emit(f"   Recent 10 range: {predictions.get('recent_10_min', 0):.2f}x - {predictions.get('recent_10_max', 0):.2f}x")
             if 'trend' in predictions:
-                print(f"   Trend: {predictions['trend']}")
+                emit(f"   Trend: {predictions['trend']}")
 
             # Show all prediction methods
-            print(f"\n📊 PREDICTION METHODS")
-            print("-"*60)
+            emit(f"\n📊 PREDICTION METHODS")
+            emit("-"*60)
 
             if 'sma_10' in predictions:
-                print(f"SMA (10 games):      {predictions['sma_10']:.2f}x")
+                emit(f"SMA (10 games):      {predictions['sma_10']:.2f}x")
             if 'sma_50' in predictions:
-                print(f"SMA (50 games):      {predictions['sma_50']:.2f}x")
+                emit(f"SMA (50 games):      {predictions['sma_50']:.2f}x")
             if 'sma_100' in predictions:
-                print(f"SMA (100 games):     {predictions['sma_100']:.2f}x")
+                emit(f"SMA (100 games):     {predictions['sma_100']:.2f}x")
             if 'ema' in predictions:
-                print(f"EMA (exponential):   {predictions['ema']:.2f}x")
+                emit(f"EMA (exponential):   {predictions['ema']:.2f}x")
             if 'wma' in predictions:
-                print(f"WMA (weighted):      {predictions['wma']:.2f}x")
+                emit(f"WMA (weighted):      {predictions['wma']:.2f}x")
             if 'pattern_based' in predictions:
                 matches = predictions.get('pattern_matches', 0)
-                print(f"Pattern-based:       {predictions['pattern_based']:.2f}x ({matches} similar)")
+                emit(f"Pattern-based:       {predictions['pattern_based']:.2f}x ({matches} similar)")
             if 'median' in predictions:
-                print(f"Historical median:   {predictions['median']:.2f}x")
+                emit(f"Historical median:   {predictions['median']:.2f}x")
             if 'mode_range' in predictions:
-                print(f"Most common range:   {predictions['mode_range']:.2f}x")
+                emit(f"Most common range:   {predictions['mode_range']:.2f}x")
             if 'trend_adjusted' in predictions:
-                print(f"Trend-adjusted:      {predictions['trend_adjusted']:.2f}x")
+                emit(f"Trend-adjusted:      {predictions['trend_adjusted']:.2f}x")
 
             # Consensus prediction
             if 'consensus' in predictions:
-                print(f"\n{'='*60}")
-                print(f"🎯 CONSENSUS PREDICTION: {predictions['consensus']:.2f}x")
-                print(f"   Confidence: {predictions.get('confidence', 'Unknown')}")
-                print(f"   Std deviation: ±{predictions.get('prediction_std', 0):.2f}x")
-                print(f"{'='*60}")
+                emit(f"\n{'='*60}")
+                emit(f"🎯 CONSENSUS PREDICTION: {predictions['consensus']:.2f}x")
+                emit(f"   Confidence: {predictions.get('confidence', 'Unknown')}")
+                emit(f"   Std deviation: ±{predictions.get('prediction_std', 0):.2f}x")
+                emit(f"{'='*60}")
 
                 # Interpretation
                 consensus = predictions['consensus']
                 if consensus < 1.5:
-                    print(f"⚠️  Prediction suggests VERY LOW crash (high risk)")
+                    emit(f"⚠️  Prediction suggests VERY LOW crash (high risk)")
                 elif consensus < 2.0:
-                    print(f"⚠️  Prediction suggests LOW crash")
+                    emit(f"⚠️  Prediction suggests LOW crash")
                 elif consensus < 3.0:
-                    print(f"✅ Prediction suggests MEDIUM crash")
+                    emit(f"✅ Prediction suggests MEDIUM crash")
                 elif consensus < 5.0:
-                    print(f"🚀 Prediction suggests HIGH crash")
+                    emit(f"🚀 Prediction suggests HIGH crash")
                 else:
-                    print(f"🚀 Prediction suggests VERY HIGH crash")
+                    emit(f"🚀 Prediction suggests VERY HIGH crash")
 
-                print(f"\n⚠️  DISCLAIMER: Predictions are statistical estimates only.")
-                print(f"    Past performance does not guarantee future results.")
-                print(f"    This game has a house edge - you will lose money over time.")
+                emit(f"\n⚠️  DISCLAIMER: Predictions are statistical estimates only.")
+                emit(f"    Past performance does not guarantee future results.")
+                emit(f"    This game has a house edge - you will lose money over time.")
         else:
-            print(f"\n⚠️  {predictions.get('error', 'Unable to generate predictions')}")
+            emit(f"\n⚠️  {predictions.get('error', 'Unable to generate predictions')}")
+
+        emit("\n" + "="*60)
+        emit("ANALYSIS COMPLETE")
+        emit("="*60 + "\n")
 
-        print("\n" + "="*60)
-        print("ANALYSIS COMPLETE")
-        print("="*60 + "\n")
+        sys.stdout.write('\n'.join(out) + '\n')
 
     def export_player_stats(self, output_file: str = 'player_stats.json') -> None:
         """Export detailed player statistics to JSON file
@@ -1010,23 +2086,43 @@ class GameAnalyzer:
         Args:
             output_file: Path to output JSON file
         """
-        player_stats = self.analyze_player_behavior()
-
-        # Convert to serializable format
-        export_data = []
-        for wallet, stats in player_stats.get('player_stats', {}).items():
-            export_data.append({
-                'wallet': wallet,
-                **stats,
-                'win_rate': stats['wins'] / stats['total_bets'] if stats['total_bets'] > 0 else 0,
-                'net_profit': stats['total_won'] - stats['total_wagered']
-            })
-
-        # Sort by total wagered
-        export_data.sort(key=lambda x: x['total_wagered'], reverse=True)
-
-        with open(output_file, 'w') as f:
-            json.dump(export_data, f, indent=2)
+        player_stats = self.analyze_player_behavior().get('player_stats', {})
+
+        wallets = list(player_stats.keys())
+        stats_list = list(player_stats.values())
+        k = len(stats_list)
+
+        # Derive win_rate/net_profit as two vectorized expressions and sort
+        # by wagered with one argsort over a float64 column, instead of
+        # recomputing both per player and sorting with a Python key callback
+        counts = np.fromiter(
+            (s['total_bets'] for s in stats_list), dtype=np.float64, count=k)
+        wagered = np.fromiter(
+            (s['total_wagered'] for s in stats_list), dtype=np.float64, count=k)
+        won = np.fromiter(
+            (s['total_won'] for s in stats_list), dtype=np.float64, count=k)
+        wins = np.fromiter(
+            (s['wins'] for s in stats_list), dtype=np.float64, count=k)
+
+        # tolist() converts to plain Python floats in C, keeping the records
+        # serializable by every JSON backend
+        win_rate = np.divide(wins, counts,
+                             out=np.zeros(k), where=counts > 0).tolist()
+        net_profit = (won - wagered).tolist()
+
+        order = np.argsort(-wagered, kind='stable')
+        export_data = [
+            {'wallet': wallets[i], **stats_list[i],
+             'win_rate': win_rate[i], 'net_profit': net_profit[i]}
+            for i in order
+        ]
+
+        if _orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(_orjson.dumps(export_data, option=_orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(export_data, f, indent=2)
 
         print(f"✓ Player statistics exported to {output_file}")
 
@@ -1034,14 +2130,16 @@ class GameAnalyzer:
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: python analyze_games.py <jsonl_file> [--limit N] [--export-players]")
+        print("Usage: python analyze_games.py <jsonl_file> [--limit N] [--stream] [--export-players]")
         print("\nOptions:")
         print("  --limit N         : Analyze only first N games (default: all)")
+        print("  --stream          : Stream the file into columns only (low memory)")
         print("  --export-players  : Export detailed player stats to player_stats.json")
         sys.exit(1)
 
     filepath = sys.argv[1]
     limit = None
+    stream = False
     export_players = False
 
     # Parse arguments
@@ -1050,6 +2148,9 @@ def main():
         if sys.argv[i] == '--limit' and i + 1 < len(sys.argv):
             limit = int(sys.argv[i + 1])
             i += 2
+        elif sys.argv[i] == '--stream':
+            stream = True
+            i += 1
         elif sys.argv[i] == '--export-players':
             export_players = True
             i += 1
@@ -1058,7 +2159,10 @@ def main():
 
     # Run analysis
     analyzer = GameAnalyzer(filepath)
-    analyzer.load_data(limit=limit)
+    if stream:
+        analyzer.load_streaming()
+    else:
+        analyzer.load_data(limit=limit)
     analyzer.run_full_analysis()
 
     if export_players: